@@ -3,7 +3,7 @@ from __future__ import annotations
 """Generic language detection utilities for all preprocessing phases."""
 
 import re
-from typing import Optional, Set
+from typing import Optional, Set, Tuple
 
 DE_TRIGGER_CHARS: Set[str] = {"ue", "oe", "ae", "ss"}
 DE_KEYWORDS = {
@@ -79,25 +79,32 @@ DATE_KEYWORDS_EN = {
 }
 
 
-def compute_language_hint(text: str) -> str:
-    """Return a coarse language label for the provided text."""
+NON_WORD_RE = re.compile(r"[^A-Za-z0-9 ]")
+DE_DATE_RE = re.compile(r"\b\d{1,2}\.\d{1,2}\.\d{2,4}\b")
+EN_DATE_RE = re.compile(r"\b\d{1,2}/\d{1,2}/\d{2,4}\b")
+DE_AMOUNT_RE = re.compile(r"\b\d{1,3}(?:\.\d{3})*,\d{2}\b")
+EN_AMOUNT_RE = re.compile(r"\b\d{1,3}(?:,\d{3})*\.\d{2}\b")
 
-    if not text:
-        return "unknown"
-    normalized = re.sub(r"[^A-Za-z0-9 ]", " ", text).lower()
-    tokens = [tok for tok in normalized.split() if tok]
+
+def _compute_language_from_text(text: str) -> str:
+    tokens = NON_WORD_RE.sub(" ", text).lower().split()
     if not tokens:
         return "unknown"
-    de_scores = sum(
-        1
-        for tok in tokens
-        if tok in DE_KEYWORDS or any(marker in tok for marker in DE_TRIGGER_CHARS)
-    )
-    en_scores = sum(1 for tok in tokens if tok in EN_KEYWORDS)
-    if any(tok in DATE_KEYWORDS_DE for tok in tokens):
-        de_scores += 1
-    if any(tok in DATE_KEYWORDS_EN for tok in tokens):
-        en_scores += 1
+    de_scores = 0
+    en_scores = 0
+    de_date = False
+    en_date = False
+    for tok in tokens:
+        if tok in DE_KEYWORDS or any(marker in tok for marker in DE_TRIGGER_CHARS):
+            de_scores += 1
+        if tok in EN_KEYWORDS:
+            en_scores += 1
+        if tok in DATE_KEYWORDS_DE:
+            de_date = True
+        if tok in DATE_KEYWORDS_EN:
+            en_date = True
+    de_scores += de_date
+    en_scores += en_date
     if de_scores == 0 and en_scores == 0:
         return "unknown"
     if de_scores > 0 and en_scores > 0 and abs(de_scores - en_scores) <= 1:
@@ -105,16 +112,12 @@ def compute_language_hint(text: str) -> str:
     return "de" if de_scores > en_scores else "en"
 
 
-def compute_locale_hint(text: str) -> str:
-    """Return a locale hint derived from number/date formats found in text."""
-
-    if not text:
-        return "unknown"
-    has_de = bool(re.search(r"\b\d{1,2}\.\d{1,2}\.\d{2,4}\b", text))
-    has_en = bool(re.search(r"\b\d{1,2}/\d{1,2}/\d{2,4}\b", text))
-    if re.search(r"\b\d{1,3}(?:\.\d{3})*,\d{2}\b", text):
+def _compute_locale_from_text(text: str) -> str:
+    has_de = DE_DATE_RE.search(text) is not None
+    has_en = EN_DATE_RE.search(text) is not None
+    if not has_de and DE_AMOUNT_RE.search(text):
         has_de = True
-    if re.search(r"\b\d{1,3}(?:,\d{3})*\.\d{2}\b", text):
+    if not has_en and EN_AMOUNT_RE.search(text):
         has_en = True
     if has_de and has_en:
         return "mixed"
@@ -125,6 +128,30 @@ def compute_locale_hint(text: str) -> str:
     return "unknown"
 
 
+def compute_language_hint(text: str) -> str:
+    """Return a coarse language label for the provided text."""
+
+    if not text:
+        return "unknown"
+    return _compute_language_from_text(text)
+
+
+def compute_locale_hint(text: str) -> str:
+    """Return a locale hint derived from number/date formats found in text."""
+
+    if not text:
+        return "unknown"
+    return _compute_locale_from_text(text)
+
+
+def compute_language_and_locale_hint(text: str) -> Tuple[str, str]:
+    """Return ``(language_hint, locale_hint)`` for ``text`` in one call."""
+
+    if not text:
+        return "unknown", "unknown"
+    return _compute_language_from_text(text), _compute_locale_from_text(text)
+
+
 def compute_merged_language_hint(existing: Optional[str], new_hint: str) -> str:
     """Combine two language hints using the legacy heuristic."""
 
@@ -147,6 +174,7 @@ compute_readers_merged_language_hint = compute_merged_language_hint
 __all__ = [
     "compute_language_hint",
     "compute_locale_hint",
+    "compute_language_and_locale_hint",
     "compute_merged_language_hint",
     # Backwards-compatible aliases for readers stage
     "compute_readers_language_hint",
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import mimetypes
 import os
-from typing import Any, Dict, List, Sequence, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 try:
     import fitz  # type: ignore
@@ -19,6 +22,11 @@ DEFAULT_IMG_AREA_THR = 0.35
 DEFAULT_TEXT_LEN_THR = 200
 DEFAULT_WORDS_THR = 15
 DEFAULT_BLOCKS_THR = 3
+DEFAULT_MAX_WORKERS = 8
+PARALLEL_MIN_PATHS = 4
+
+# PyMuPDF is not thread-safe; every fitz call in this module runs under it.
+_FITZ_LOCK = threading.Lock()
 
 DEFAULT_RECOMMENDATION: Dict[str, Any] = {
     "mode": "native",
@@ -44,6 +52,17 @@ TXT_EXTENSIONS = {
 }
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".tiff", ".tif", ".bmp", ".gif", ".webp"}
 
+# Non-PDF outcomes: (file_type, ocr_recommended, note, recommended).
+_DOCX_OUTCOME = (FileType.DOCX, False, "docx", {"mode": "native", "tables_mode": "detect", "lang": "deu+eng"})
+_TXT_OUTCOME = (FileType.TXT, False, "text", {"mode": "native", "tables_mode": "off", "lang": "deu+eng"})
+_IMAGE_OUTCOME = (FileType.IMAGE, True, "image", {"mode": "ocr", "dpi": 320, "psm": 6, "tables_mode": "detect", "lang": "deu+eng"})
+_EXTENSION_OUTCOMES: Dict[str, Tuple[FileType, bool, str, Dict[str, Any]]] = {
+    **{ext: _DOCX_OUTCOME for ext in DOCX_EXTENSIONS},
+    **{ext: _TXT_OUTCOME for ext in TXT_EXTENSIONS},
+    **{ext: _IMAGE_OUTCOME for ext in IMAGE_EXTENSIONS},
+}
+_get_extension_outcome = _EXTENSION_OUTCOMES.get
+
 
 __all__ = [
     "DEFAULT_SAMPLE_PAGES",
@@ -52,6 +71,9 @@ __all__ = [
     "DEFAULT_TEXT_LEN_THR",
     "DEFAULT_WORDS_THR",
     "DEFAULT_BLOCKS_THR",
+    "DEFAULT_MAX_WORKERS",
+    "PARALLEL_MIN_PATHS",
+    "compute_detect_type_worker_count",
     "process_detect_type_file",
     "process_detect_type_many",
 ]
@@ -131,7 +153,7 @@ def compute_detect_type_page_metrics(
     }
 
 
-def process_detect_type_pdf_document(
+def _process_detect_type_pdf_document(
     path: str,
     sample_pages: int = DEFAULT_SAMPLE_PAGES,
     topk_image_pages: int = DEFAULT_TOPK_IMAGE_PAGES,
@@ -140,9 +162,6 @@ def process_detect_type_pdf_document(
     words_thr: int = DEFAULT_WORDS_THR,
     blocks_thr: int = DEFAULT_BLOCKS_THR,
 ) -> Dict[str, Any]:
-    if fitz is None:
-        return {"pages": 0, "sampled_pages": 0, "scanned": None, "confidence": 0.0}
-
     try:
         doc = fitz.open(path)
     except Exception:
@@ -206,6 +225,29 @@ def process_detect_type_pdf_document(
     return meta
 
 
+def process_detect_type_pdf_document(
+    path: str,
+    sample_pages: int = DEFAULT_SAMPLE_PAGES,
+    topk_image_pages: int = DEFAULT_TOPK_IMAGE_PAGES,
+    img_area_thr: float = DEFAULT_IMG_AREA_THR,
+    text_len_thr: int = DEFAULT_TEXT_LEN_THR,
+    words_thr: int = DEFAULT_WORDS_THR,
+    blocks_thr: int = DEFAULT_BLOCKS_THR,
+) -> Dict[str, Any]:
+    if fitz is None:
+        return {"pages": 0, "sampled_pages": 0, "scanned": None, "confidence": 0.0}
+    with _FITZ_LOCK:
+        return _process_detect_type_pdf_document(
+            path,
+            sample_pages=sample_pages,
+            topk_image_pages=topk_image_pages,
+            img_area_thr=img_area_thr,
+            text_len_thr=text_len_thr,
+            words_thr=words_thr,
+            blocks_thr=blocks_thr,
+        )
+
+
 def process_detect_type_file(
     path: str,
     sample_pages: int = DEFAULT_SAMPLE_PAGES,
@@ -254,17 +296,17 @@ def process_detect_type_file(
             recommended=recommended,
         )
 
-    if ext in DOCX_EXTENSIONS or (mime == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"):
-        recommended = {"mode": "native", "tables_mode": "detect", "lang": "deu+eng"}
-        return FileTypeResult(path, ext, mime, FileType.DOCX, False, {"note": "docx"}, confidence=0.95, recommended=recommended)
-
-    if ext in TXT_EXTENSIONS or (mime and (mime.startswith("text/") or "json" in mime or "yaml" in mime or "csv" in mime)):
-        recommended = {"mode": "native", "tables_mode": "off", "lang": "deu+eng"}
-        return FileTypeResult(path, ext, mime, FileType.TXT, False, {"note": "text"}, confidence=0.95, recommended=recommended)
-
-    if ext in IMAGE_EXTENSIONS or (mime and mime.startswith("image/")):
-        recommended = {"mode": "ocr", "dpi": 320, "psm": 6, "tables_mode": "detect", "lang": "deu+eng"}
-        return FileTypeResult(path, ext, mime, FileType.IMAGE, True, {"note": "image"}, confidence=0.95, recommended=recommended)
+    outcome = _get_extension_outcome(ext)
+    if outcome is None and mime:
+        if mime == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+            outcome = _DOCX_OUTCOME
+        elif mime.startswith("text/") or "json" in mime or "yaml" in mime or "csv" in mime:
+            outcome = _TXT_OUTCOME
+        elif mime.startswith("image/"):
+            outcome = _IMAGE_OUTCOME
+    if outcome is not None:
+        file_type, ocr_rec, note, recommended = outcome
+        return FileTypeResult(path, ext, mime, file_type, ocr_rec, {"note": note}, confidence=0.95, recommended=dict(recommended))
 
     return FileTypeResult(
         path,
@@ -278,22 +320,42 @@ def process_detect_type_file(
     )
 
 
-def process_detect_type_many(paths: Sequence[str], **kwargs: Any) -> List[FileTypeResult]:
-    results: List[FileTypeResult] = []
-    for path in paths:
-        try:
-            results.append(process_detect_type_file(path, **kwargs))
-        except Exception as exc:  # pragma: no cover - defensive
-            results.append(
-                FileTypeResult(
-                    path,
-                    os.path.splitext(path)[1].lower(),
-                    get_detect_type_mime_guess(path),
-                    FileType.UNKNOWN,
-                    False,
-                    {"error": f"detect_failed: {exc}"},
-                    confidence=0.0,
-                    recommended={"mode": "mixed"},
-                )
-            )
-    return results
+def _process_detect_type_guarded(path: str, **kwargs: Any) -> FileTypeResult:
+    try:
+        return process_detect_type_file(path, **kwargs)
+    except Exception as exc:  # pragma: no cover - defensive
+        return FileTypeResult(
+            path,
+            os.path.splitext(path)[1].lower(),
+            get_detect_type_mime_guess(path),
+            FileType.UNKNOWN,
+            False,
+            {"error": f"detect_failed: {exc}"},
+            confidence=0.0,
+            recommended={"mode": "mixed"},
+        )
+
+
+def compute_detect_type_worker_count(path_count: int, max_workers: Optional[int] = None) -> int:
+    """Return how many worker threads to use for ``path_count`` inputs."""
+
+    if path_count <= PARALLEL_MIN_PATHS:
+        return 1
+    requested = max_workers if max_workers is not None else DEFAULT_MAX_WORKERS
+    return max(1, min(int(requested), path_count))
+
+
+def process_detect_type_many(
+    paths: Sequence[str],
+    max_workers: Optional[int] = None,
+    **kwargs: Any,
+) -> List[FileTypeResult]:
+    paths = list(paths)
+    workers = compute_detect_type_worker_count(len(paths), max_workers)
+    if workers > 1:
+        # Reads and MIME sniffing overlap across threads; PDF sniffing is
+        # serialised by _FITZ_LOCK. The guard keeps failures per file.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(partial(_process_detect_type_guarded, **kwargs), paths))
+    detect = _process_detect_type_guarded
+    return [detect(path, **kwargs) for path in paths]
@@ -2,9 +2,21 @@ from __future__ import annotations
 
 """Utilities to detect text encoding and convert payloads to UTF-8."""
 
+import codecs
+import unicodedata
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from charset_normalizer import from_bytes as charset_from_bytes  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    charset_from_bytes = None
+
+try:
+    import cchardet  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    cchardet = None
 
 try:
     import chardet  # type: ignore
@@ -12,6 +24,16 @@ except Exception:  # pragma: no cover - optional dependency
     chardet = None
 
 _UTF8_BOMS = (b"\xef\xbb\xbf",)
+# UTF-32 first: its little-endian BOM starts with the UTF-16 one.
+_UNICODE_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# Used when a sample is not UTF-8 and no detector library is installed.
+FALLBACK_ENCODING = "cp1252"
 
 
 @dataclass
@@ -36,6 +58,38 @@ def check_encoding_has_bom(data: bytes) -> bool:
     return any(data.startswith(bom) for bom in _UTF8_BOMS)
 
 
+def get_encoding_from_bom(data: bytes) -> Optional[str]:
+    head = data[:4]
+    for bom, encoding in _UNICODE_BOMS:
+        if head.startswith(bom):
+            return encoding
+    return None
+
+
+def check_encoding_is_utf8(sample: bytes, *, truncated: bool = False) -> bool:
+    # A truncated sample may end inside a multi-byte sequence; that is not an error.
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=not truncated)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def compute_encoding_guess(sample: bytes) -> Tuple[Optional[str], Optional[float]]:
+    """Ask the fastest installed detector for the encoding of ``sample``."""
+
+    if charset_from_bytes is not None:
+        best = charset_from_bytes(sample).best()
+        if best is None:
+            return None, None
+        return best.encoding, round(1.0 - float(best.chaos), 4)
+    detector = cchardet if cchardet is not None else chardet
+    if detector is None:
+        return None, None
+    result = detector.detect(sample) or {}
+    return result.get("encoding"), result.get("confidence")
+
+
 def normalize_encoding_newlines(text: str, policy: str = "lf") -> str:
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     if policy == "crlf":
@@ -48,18 +102,23 @@ def get_encoding_detection_for_path(path: str, sample_bytes: int = 1024 * 1024)
     if not file_path.exists():
         return EncodingDetection(encoding=None, confidence=None, bom=False, is_utf8=False, sample_len=0)
 
-    data = file_path.read_bytes()
-    sample = data[:sample_bytes]
-    bom = check_encoding_has_bom(sample)
+    with file_path.open("rb") as handle:
+        sample = handle.read(sample_bytes)
+        truncated = bool(handle.read(1))
+
+    encoding: Optional[str] = get_encoding_from_bom(sample)
+    confidence: Optional[float] = 1.0 if encoding else None
+    bom = encoding is not None
 
-    encoding: Optional[str] = None
-    confidence: Optional[float] = None
+    # Most inputs are UTF-8 (or ASCII): validate the whole sample before
+    # running a statistical detector over it.
+    is_utf8 = check_encoding_is_utf8(sample, truncated=truncated)
+    if encoding is None and is_utf8:
+        encoding, confidence = "utf-8", 1.0
 
-    if chardet is not None and sample:
+    if encoding is None and sample:
         try:
-            result = chardet.detect(sample) or {}
-            encoding = result.get("encoding")
-            confidence = result.get("confidence")
+            encoding, confidence = compute_encoding_guess(sample)
         except Exception:  # pragma: no cover - defensive
             encoding = None
             confidence = None
@@ -69,13 +128,7 @@ def get_encoding_detection_for_path(path: str, sample_bytes: int = 1024 * 1024)
         if normalized == "ascii":
             encoding = "utf-8"
     else:
-        encoding = "utf-8"
-
-    try:
-        sample.decode("utf-8")
-        is_utf8 = True
-    except Exception:
-        is_utf8 = False
+        encoding = FALLBACK_ENCODING if sample and not is_utf8 else "utf-8"
 
     return EncodingDetection(
         encoding=encoding,
@@ -109,16 +162,19 @@ def normalize_encoding_file_to_utf8(
 
     encoding = detection.encoding or "utf-8"
     raw = file_path.read_bytes()
-    if check_encoding_has_bom(raw):
-        raw = raw[len(_UTF8_BOMS[0]):]
+    # Decode through a view so skipping the BOM does not copy the whole file.
+    payload = memoryview(raw)[len(_UTF8_BOMS[0]) if check_encoding_has_bom(raw) else 0:]
 
     try:
-        text = raw.decode(encoding, errors=errors)
+        text = str(payload, encoding, errors)
     except LookupError:
-        text = raw.decode("utf-8", errors="replace")
+        text = str(payload, "utf-8", "replace")
     except UnicodeDecodeError:
-        text = raw.decode(encoding, errors="replace")
+        text = str(payload, encoding, "replace")
+    del payload, raw
 
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
     text = normalize_encoding_newlines(text, newline_policy)
 
     if dest_path is None:
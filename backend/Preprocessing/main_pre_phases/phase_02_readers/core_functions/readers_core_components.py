@@ -2,7 +2,6 @@ from __future__ import annotations
 
 """Core business logic for component processing in the readers stage."""
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
@@ -17,6 +16,7 @@ from ..schemas.readers_schema_types import (
     RawTable,
     TimingBreakdown,
 )
+from ..internal_helpers.readers_helper_json import load_readers_json
 
 _TIMING_KEYS = {
     "detect",
@@ -88,13 +88,13 @@ def get_readers_jsonl_rows(path: Path) -> List[Dict[str, Any]]:
     if not path.exists():
         return []
     items: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
+    with path.open("rb") as handle:
         for line in handle:
             line = line.strip()
             if not line:
                 continue
             try:
-                items.append(json.loads(line))
+                items.append(load_readers_json(line))
             except Exception:
                 continue
     return items
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 """DOCX parsing helpers for the readers runtime."""
 
-from typing import List
+import zipfile
+from typing import Dict, Iterable, List
+
+try:  # Optional dependency: streaming parser for word/document.xml
+    from lxml import etree  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    etree = None  # type: ignore
 
 try:
     from docx import Document  # type: ignore
@@ -12,26 +18,153 @@ except Exception as exc:  # pragma: no cover - optional dependency
 else:
     DOCX_IMPORT_ERROR = None
 
+DOCX_MAIN_PART = "word/document.xml"
+_OFFICE_DOCUMENT_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+_PACKAGE_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = f"{_W}body"
+_W_P = f"{_W}p"
+_W_TBL = f"{_W}tbl"
+_W_TR = f"{_W}tr"
+_W_TC = f"{_W}tc"
+_W_R = f"{_W}r"
+_W_HYPERLINK = f"{_W}hyperlink"
+_W_VAL = f"{_W}val"
+_W_TYPE = f"{_W}type"
+# Run children and their text equivalents, as python-docx renders them.
+_RUN_TEXT = {f"{_W}tab": "\t", f"{_W}ptab": "\t", f"{_W}cr": "\n", f"{_W}noBreakHyphen": "-"}
+
+
+def _get_docx_run_text(run) -> str:
+    parts: List[str] = []
+    for child in run:
+        tag = child.tag
+        if tag == f"{_W}t":
+            parts.append(child.text or "")
+        elif tag == f"{_W}br":
+            if child.get(_W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_RUN_TEXT.get(tag, ""))
+    return "".join(parts)
+
+
+def _get_docx_paragraph_text(paragraph) -> str:
+    parts: List[str] = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            parts.append(_get_docx_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_get_docx_run_text(run) for run in child.iterchildren(_W_R))
+    return "".join(parts)
+
+
+def _get_docx_property(element, prop: str, name: str):
+    props = element.find(f"{_W}{prop}")
+    if props is None:
+        return None
+    return props.find(f"{_W}{name}")
+
+
+def _iter_docx_table_rows(table) -> Iterable[List[str]]:
+    """Yield cell texts per row, expanding spans the way ``row.cells`` does."""
+
+    above: Dict[int, str] = {}
+    for row in table.iterchildren(_W_TR):
+        before = _get_docx_property(row, "trPr", "gridBefore")
+        column = int(before.get(_W_VAL, 0)) if before is not None else 0
+        current: Dict[int, str] = {}
+        cells: List[str] = []
+        for cell in row.iterchildren(_W_TC):
+            span_el = _get_docx_property(cell, "tcPr", "gridSpan")
+            span = int(span_el.get(_W_VAL, 1)) if span_el is not None else 1
+            merge = _get_docx_property(cell, "tcPr", "vMerge")
+            if merge is not None and merge.get(_W_VAL, "continue") == "continue":
+                text = above.get(column, "")
+            else:
+                text = "\n".join(_get_docx_paragraph_text(p) for p in cell.iterchildren(_W_P))
+            for _ in range(span):
+                current[column] = text
+                cells.append(text)
+                column += 1
+        above = current
+        yield cells
+
+
+def get_docx_main_part(archive: zipfile.ZipFile) -> str:
+    """Return the main document part name, following ``_rels/.rels`` when it is not the usual one."""
+
+    try:
+        archive.getinfo(DOCX_MAIN_PART)
+        return DOCX_MAIN_PART
+    except KeyError:
+        pass
+    rels = etree.fromstring(archive.read("_rels/.rels"))
+    for rel in rels.iterchildren(_PACKAGE_REL):
+        if rel.get("Type") == _OFFICE_DOCUMENT_REL and rel.get("Target"):
+            return rel.get("Target").lstrip("/")
+    raise KeyError(DOCX_MAIN_PART)
+
+
+def get_docx_text_streaming(path: str) -> str:
+    """Extract DOCX text by streaming the main document part.
+
+    Produces the same string as the python-docx walk in :func:`get_docx_text`
+    without building its object graph or parsing styles, numbering and
+    settings; body elements are freed once read.
+    """
+
+    paragraphs: List[str] = []
+    table_rows: List[str] = []
+    add_paragraph = paragraphs.append
+    add_row = table_rows.append
+    with zipfile.ZipFile(path) as archive, archive.open(get_docx_main_part(archive)) as stream:
+        for _, elem in etree.iterparse(stream, events=("end",), tag=(_W_P, _W_TBL)):
+            parent = elem.getparent()
+            if parent is None or parent.tag != _W_BODY:
+                continue
+            if elem.tag == _W_P:
+                text = _get_docx_paragraph_text(elem).rstrip()
+                if text:
+                    add_paragraph(text)
+            else:
+                for cells in _iter_docx_table_rows(elem):
+                    cells = [cell.strip() for cell in cells]
+                    if any(cells):
+                        add_row(" | ".join(cells))
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+    return "\n".join(paragraphs + table_rows).strip()
+
 
 def get_docx_text(path: str) -> str:
     """Return normalized text extracted from a DOCX document."""
 
+    if etree is not None:
+        try:
+            return get_docx_text_streaming(path)
+        except (KeyError, zipfile.BadZipFile):
+            if Document is None:
+                raise
+
     if Document is None:  # pragma: no cover - dependency missing at runtime
         raise RuntimeError("python-docx is required to read DOCX files") from DOCX_IMPORT_ERROR
 
     doc = Document(path)
     parts: List[str] = []
+    append = parts.append
 
     for paragraph in doc.paragraphs:
         text = (paragraph.text or "").rstrip()
         if text:
-            parts.append(text)
+            append(text)
 
     for table in doc.tables:
         for row in table.rows:
             cells = [(cell.text or "").strip() for cell in row.cells]
             if any(cells):
-                parts.append(" | ".join(cells))
+                append(" | ".join(cells))
 
     return "\n".join(parts).strip()
 
@@ -42,4 +175,4 @@ def get_readers_docx_text(path: str) -> str:
     return get_docx_text(path)
 
 
-__all__ = ["get_docx_text", "get_readers_docx_text"]
+__all__ = ["get_docx_main_part", "get_docx_text", "get_docx_text_streaming", "get_readers_docx_text"]
@@ -3,7 +3,6 @@ from __future__ import annotations
 """Core business logic for document metadata computation in the readers stage."""
 
 import hashlib
-import json
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
@@ -20,6 +19,7 @@ from ..schemas.readers_schema_types import (
     ZoneEntry,
 )
 from ..schemas.readers_schema_output import SCHEMA_VERSION
+from ..internal_helpers.readers_helper_json import load_readers_json
 
 READER_VERSION = "unified-readers-v1"
 _DEFAULT_OCR_LANGS = "deu+eng"
@@ -108,13 +108,13 @@ def get_readers_jsonl_rows(path: Path) -> List[Dict[str, Any]]:
         return []
     entries: List[Dict[str, Any]] = []
     try:
-        with path.open("r", encoding="utf-8") as handle:
+        with path.open("rb") as handle:
             for raw_line in handle:
                 line = raw_line.strip()
                 if not line:
                     continue
                 try:
-                    obj = json.loads(line)
+                    obj = load_readers_json(line)
                 except Exception:
                     continue
                 if isinstance(obj, dict):
@@ -410,7 +410,7 @@ def compute_readers_doc_meta_payload(
     summary_path = readers_dir / "readers_summary.json"
     if summary_path.exists():
         try:
-            on_disk = json.loads(summary_path.read_text(encoding="utf-8"))
+            on_disk = load_readers_json(summary_path.read_bytes())
             disk_summary = dict(on_disk.get("summary") or {})
             merged_summary = {**summary_result, **disk_summary}
             summary_result = merged_summary
@@ -419,7 +419,7 @@ def compute_readers_doc_meta_payload(
                 summary_payload["qa"] = on_disk.get("qa")
             if on_disk.get("flags") is not None:
                 summary_payload["flags"] = on_disk.get("flags")
-            disk_tool_log = normalize_readers_tool_log(on_disk.get("tool_log") or [])
+            disk_tool_log = normalize_readers_tool_log(on_disk.get("tool_log") or disk_summary.get("tool_log") or [])
             if disk_tool_log:
                 if tool_log:
                     tool_log.extend(disk_tool_log)
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 """Native document processing helpers for the readers runtime orchestrator."""
 
+import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
 
 try:  # Optional at runtime
     import fitz  # type: ignore
@@ -23,8 +26,8 @@ except Exception:  # pragma: no cover
 
 from ..schemas.readers_schema_models import PageRecord
 from .readers_core_docx import get_docx_text
-from .readers_core_pdf import get_pdf_text
-from .readers_core_ocr import process_readers_ocr_result, run_pdf_ocr, process_readers_merge_text
+from .readers_core_pdf import get_pdf_text, release_readers_pdf_store
+from .readers_core_ocr import ReadersPdfOcrStream, process_readers_ocr_result, process_readers_merge_text
 from .readers_core_tables import process_readers_collect_tables
 from .readers_core_artifacts import process_readers_collect_image_artifacts
 
@@ -33,15 +36,19 @@ DOCX_PAGE_HEIGHT_EMU = 11.69 * 914400
 
 
 def compute_readers_safe_avg_conf(conf_list) -> float:
-    values: List[float] = []
-    for value in conf_list or []:
-        try:
-            float_value = float(value)
-        except Exception:
-            continue
-        if float_value > 0:
-            values.append(float_value)
-    return sum(values) / len(values) if values else 0.0
+    try:
+        values = np.asarray(list(conf_list or []), dtype=np.float64)
+    except (TypeError, ValueError):
+        # Mixed or malformed entries: drop the ones that do not parse.
+        parsed: List[float] = []
+        for value in conf_list or []:
+            try:
+                parsed.append(float(value))
+            except Exception:
+                continue
+        values = np.asarray(parsed, dtype=np.float64)
+    values = values[np.isfinite(values) & (values > 0)]
+    return float(values.mean()) if values.size else 0.0
 
 
 def process_readers_docx_native(orchestrator, path: Path) -> None:
@@ -182,6 +189,14 @@ def process_readers_pdf_document(orchestrator, path: Path) -> None:
         process_readers_pdf_fallback(orchestrator, path)
         return
 
+    try:
+        process_readers_pdf_pages(orchestrator, doc, path)
+    finally:
+        doc.close()
+        release_readers_pdf_store()
+
+
+def process_readers_pdf_pages(orchestrator, doc, path: Path) -> None:
     native_map: Dict[int, Dict[str, float]] = {}
     overlay_candidates: List[int] = []
     ocr_needed: List[int] = []
@@ -245,93 +260,120 @@ def process_readers_pdf_document(orchestrator, path: Path) -> None:
         else:
             ocr_needed.append(page_no)
 
-    ocr_lookup: Dict[int, Dict[str, object]] = {}
-    if ocr_needed:
-        unique_pages = sorted(set(ocr_needed))
-        ocr_lookup = run_pdf_ocr(orchestrator, path, unique_pages)
+    # Tesseract runs on worker threads while the loop below merges, blocks
+    # and collects tables for the pages that are already done; the stream
+    # renders from this same document on this thread.
+    ocr_pages: Set[int] = set(ocr_needed)
+    ocr_stream = None
+    if ocr_pages:
+        # The native pass already measured each page's fonts; the OCR DPI
+        # choice reuses them instead of extracting the page dict again.
+        font_medians = {page_no: native_map[page_no].get("font_median") for page_no in ocr_pages}
+        ocr_stream = ReadersPdfOcrStream(orchestrator, path, sorted(ocr_pages), font_medians=font_medians, doc=doc)
+    try:
+        for index, page in enumerate(doc):
+            page_no = index + 1
+            ocr_data = ocr_stream.get(page_no) if ocr_stream is not None and page_no in ocr_pages else None
+            process_readers_pdf_page_result(
+                orchestrator,
+                page,
+                path,
+                page_no,
+                mode,
+                native_map.get(page_no, {}),
+                ocr_data,
+                page_no in overlay_candidates,
+            )
+    finally:
+        if ocr_stream is not None:
+            ocr_stream.close(cancel=sys.exc_info()[0] is not None)
 
-    for index, page in enumerate(doc):
-        page_no = index + 1
-        native_data = native_map.get(page_no, {})
-        native_text = native_data.get("text", "")
-        native_conf = native_data.get("conf", 0.0)
-        native_words = native_data.get("words", 0)
-        time_ms = native_data.get("time_ms", 0.0)
-        coverage = native_data.get("coverage", 0.0)
-        image_count = native_data.get("image_count", 0)
-        decision = "native"
-        final_text = native_text
-        final_conf = native_conf
-        final_words = native_words
-        final_time = time_ms
-        native_blocks = native_data.get("blocks") or []
-        ocr_data = ocr_lookup.get(page_no)
-        ocr_avg_conf = None
-        if ocr_data and ocr_data.get("avg_conf") is not None:
-            try:
-                ocr_avg_conf = float(ocr_data.get("avg_conf") or 0.0)
-            except Exception:
-                ocr_avg_conf = float(ocr_data.get("avg_conf"))
-        if mode == "ocr":
+
+def process_readers_pdf_page_result(
+    orchestrator,
+    page,
+    path: Path,
+    page_no: int,
+    mode: str,
+    native_data: Dict[str, Any],
+    ocr_data: Optional[Dict[str, object]],
+    is_overlay: bool,
+) -> None:
+    native_text = native_data.get("text", "")
+    native_conf = native_data.get("conf", 0.0)
+    native_words = native_data.get("words", 0)
+    time_ms = native_data.get("time_ms", 0.0)
+    decision = "native"
+    final_text = native_text
+    final_conf = native_conf
+    final_words = native_words
+    final_time = time_ms
+    native_blocks = native_data.get("blocks") or []
+    ocr_avg_conf = None
+    if ocr_data and ocr_data.get("avg_conf") is not None:
+        try:
+            ocr_avg_conf = float(ocr_data.get("avg_conf") or 0.0)
+        except Exception:
+            ocr_avg_conf = float(ocr_data.get("avg_conf"))
+    if mode == "ocr":
+        final_text, final_conf, final_words, final_time = process_readers_ocr_result(native_text, ocr_data)
+        decision = "ocr"
+    elif mode == "native":
+        if not native_text.strip():
+            final_text, final_conf, final_words, final_time = process_readers_ocr_result(native_text, ocr_data)
+            decision = "ocr"
+        elif is_overlay and ocr_data:
+            merged_text, merged_conf = process_readers_merge_text(
+                native_text,
+                ocr_data.get("text") or "",
+                native_conf,
+                float(ocr_data.get("avg_conf") or 0.0),
+            )
+            final_text = merged_text
+            final_conf = merged_conf
+            final_words = len(final_text.split())
+            final_time += float(ocr_data.get("time_ms") or 0.0)
+            decision = "native+ocr"
+    else:  # mixed
+        if ocr_data is not None and not is_overlay:
             final_text, final_conf, final_words, final_time = process_readers_ocr_result(native_text, ocr_data)
             decision = "ocr"
-        elif mode == "native":
-            if not native_text.strip():
-                final_text, final_conf, final_words, final_time = process_readers_ocr_result(native_text, ocr_data)
-                decision = "ocr"
-            elif page_no in overlay_candidates and ocr_data:
-                merged_text, merged_conf = process_readers_merge_text(
-                    native_text,
-                    ocr_data.get("text") or "",
-                    native_conf,
-                    float(ocr_data.get("avg_conf") or 0.0),
-                )
-                final_text = merged_text
-                final_conf = merged_conf
-                final_words = len(final_text.split())
-                final_time += float(ocr_data.get("time_ms") or 0.0)
-                decision = "native+ocr"
-        else:  # mixed
-            if page_no in ocr_lookup and page_no not in overlay_candidates:
-                final_text, final_conf, final_words, final_time = process_readers_ocr_result(native_text, ocr_data)
-                decision = "ocr"
-            elif page_no in overlay_candidates and ocr_data:
-                merged_text, merged_conf = process_readers_merge_text(
-                    native_text,
-                    ocr_data.get("text") or "",
-                    native_conf,
-                    float(ocr_data.get("avg_conf") or 0.0),
-                )
-                final_text = merged_text
-                final_conf = merged_conf
-                final_words = len(final_text.split())
-                final_time += float(ocr_data.get("time_ms") or 0.0)
-                decision = "native+ocr"
-            elif not native_text.strip():
-                final_text, final_conf, final_words, final_time = process_readers_ocr_result(native_text, ocr_data)
-                decision = "ocr"
-
-        orchestrator._record_page_blocks(page_no, decision, native_blocks, final_text, ocr_avg_conf)
-        if not final_text.strip():
-            orchestrator._log_warning(f"empty_page_text:p{page_no}")
-        orchestrator._records.append(
-            PageRecord(
-                file=str(path),
-                page=page_no,
-                source=decision,
-                text=final_text,
-                conf=round(final_conf, 2),
-                time_ms=round(final_time, 2),
-                words=final_words,
-                chars=len(final_text or ""),
-                ocr_conf_avg=ocr_avg_conf,
+        elif is_overlay and ocr_data:
+            merged_text, merged_conf = process_readers_merge_text(
+                native_text,
+                ocr_data.get("text") or "",
+                native_conf,
+                float(ocr_data.get("avg_conf") or 0.0),
             )
+            final_text = merged_text
+            final_conf = merged_conf
+            final_words = len(final_text.split())
+            final_time += float(ocr_data.get("time_ms") or 0.0)
+            decision = "native+ocr"
+        elif not native_text.strip():
+            final_text, final_conf, final_words, final_time = process_readers_ocr_result(native_text, ocr_data)
+            decision = "ocr"
+
+    orchestrator._record_page_blocks(page_no, decision, native_blocks, final_text, ocr_avg_conf)
+    if not final_text.strip():
+        orchestrator._log_warning(f"empty_page_text:p{page_no}")
+    orchestrator._records.append(
+        PageRecord(
+            file=str(path),
+            page=page_no,
+            source=decision,
+            text=final_text,
+            conf=round(final_conf, 2),
+            time_ms=round(final_time, 2),
+            words=final_words,
+            chars=len(final_text or ""),
+            ocr_conf_avg=ocr_avg_conf,
         )
-        orchestrator._page_decisions.append(decision)
-        if final_text.strip():
-            process_readers_collect_tables(orchestrator, page, path, page_no, decision, ocr_data)
-        orchestrator._update_zones(page, page_no)
-    doc.close()
+    )
+    orchestrator._page_decisions.append(decision)
+    if final_text.strip():
+        process_readers_collect_tables(orchestrator, page, path, page_no, decision, ocr_data)
+    orchestrator._update_zones(page, page_no)
 
 
 def process_readers_ocr_image(orchestrator, path: Path) -> None:
@@ -362,7 +404,7 @@ def process_readers_ocr_image(orchestrator, path: Path) -> None:
         data = pytesseract.image_to_data(image, output_type="dict", config=cfg)
         words = data.get("text", []) or []
         confs = data.get("conf", []) or []
-        text = " \n".join(word for word in words if word and word.strip() and word != "-1")
+        text = " \n".join([word for word in words if word and word != "-1" and not word.isspace()])
         conf = compute_readers_safe_avg_conf(confs)
         orchestrator._log_tool_event(
             "pytesseract",
@@ -393,9 +435,12 @@ def process_readers_ocr_image(orchestrator, path: Path) -> None:
 
 
 __all__ = [
+    "compute_readers_safe_avg_conf",
     "process_readers_docx_native",
     "process_readers_text_native",
     "process_readers_pdf_fallback",
     "process_readers_pdf_document",
+    "process_readers_pdf_pages",
+    "process_readers_pdf_page_result",
     "process_readers_ocr_image",
 ]
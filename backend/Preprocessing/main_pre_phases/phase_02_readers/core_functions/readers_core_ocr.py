@@ -2,10 +2,17 @@ from __future__ import annotations
 
 """OCR execution helpers for the readers runtime orchestrator."""
 
-import io
+import math
+import os
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 try:  # Optional dependency
     import fitz  # type: ignore
@@ -22,6 +29,11 @@ try:  # Optional dependency
 except Exception:  # pragma: no cover - pytesseract missing
     pytesseract = None
 
+try:  # Optional dependency: resident Tesseract engine, preferred over pytesseract
+    import tesserocr  # type: ignore
+except Exception:  # pragma: no cover - tesserocr missing
+    tesserocr = None
+
 from backend.Preprocessing.main_pre_helpers.main_pre_helpers_image import process_readers_preprocess_pipeline, to_readers_pil_image
 from core.monitoring import observe_ocr_time_ms, observe_ocr_confidence
 
@@ -35,23 +47,39 @@ def compute_readers_median_font_size(page) -> Optional[float]:
         data = page.get_text("dict")
     except Exception:
         return None
-    sizes: List[float] = []
+    return compute_readers_median_font_size_from_dict(data)
+
+
+def _iter_readers_span_sizes(data: Dict[str, object]) -> Iterator[float]:
     for block in data.get("blocks", []):
         for line in block.get("lines", []):
             for span in line.get("spans", []):
                 size = span.get("size")
                 if isinstance(size, (int, float)) and size > 0:
-                    sizes.append(float(size))
-    if not sizes:
+                    yield size
+
+
+def compute_readers_median_font_size_from_dict(data: Dict[str, object]) -> Optional[float]:
+    """Median span font size of an already extracted ``get_text("dict")`` page."""
+
+    sizes = np.fromiter(_iter_readers_span_sizes(data), dtype=np.float64)
+    if not sizes.size:
         return None
-    sizes.sort()
-    return float(sizes[len(sizes) // 2])
+    # Upper median by selection rather than a full sort.
+    middle = sizes.size // 2
+    return float(np.partition(sizes, middle)[middle])
+
 
+_MEDIAN_UNSET = object()
+
+
+def compute_readers_recommended_dpi(page, default: int = 300, mode: str = "fixed", median=_MEDIAN_UNSET) -> int:
+    """Pick the render DPI; ``median`` skips re-extracting the page fonts when known."""
 
-def compute_readers_recommended_dpi(page, default: int = 300, mode: str = "fixed") -> int:
     if mode != "auto":
         return compute_readers_clamped_dpi(int(default))
-    median = compute_readers_median_font_size(page)
+    if median is _MEDIAN_UNSET:
+        median = compute_readers_median_font_size(page)
     if median is None:
         dpi = 350
     elif median < 7.5:
@@ -63,7 +91,269 @@ def compute_readers_recommended_dpi(page, default: int = 300, mode: str = "fixed
     return compute_readers_clamped_dpi(dpi)
 
 
-def run_ocr_pages(
+OCR_MAX_MEGAPIXELS = 30.0
+OCR_BUDGET_MIN_DPI = 150
+
+
+def compute_readers_budget_dpi(page, dpi: int, max_megapixels: Optional[float] = OCR_MAX_MEGAPIXELS) -> int:
+    """Lower ``dpi`` so the rendered page stays within ``max_megapixels``."""
+
+    if not max_megapixels or max_megapixels <= 0:
+        return dpi
+    rect = page.rect
+    area_in = (rect.width / 72.0) * (rect.height / 72.0)
+    if area_in <= 0 or area_in * dpi * dpi <= max_megapixels * 1e6:
+        return dpi
+    budget = int(math.sqrt(max_megapixels * 1e6 / area_in))
+    return max(min(OCR_BUDGET_MIN_DPI, dpi), min(budget, dpi))
+
+
+# PyMuPDF is not thread-safe: pages are always rendered on the thread that
+# drives the iterator (the one that owns the document); only the Tesseract
+# calls on the finished images run on worker threads.
+OCR_PAGE_MAX_WORKERS = 8
+
+
+def compute_readers_ocr_page_workers(requested: Optional[int] = None) -> int:
+    try:
+        limit = int(requested) if requested else OCR_PAGE_MAX_WORKERS
+    except (TypeError, ValueError):
+        limit = OCR_PAGE_MAX_WORKERS
+    return max(1, min(limit, OCR_PAGE_MAX_WORKERS, os.cpu_count() or 1))
+
+
+def compute_readers_ocr_data_text(data: Dict[str, List[object]]) -> str:
+    """Rebuild plain text from an ``image_to_data`` dict: words, lines, blank-line paragraphs."""
+
+    paragraphs: List[str] = []
+    current_lines: List[str] = []
+    current_words: List[str] = []
+    line_key: Optional[Tuple[object, object, object]] = None
+    rows = zip(data.get("text") or [], data.get("block_num") or [], data.get("par_num") or [], data.get("line_num") or [])
+    for word, block_num, par_num, line_num in rows:
+        word = str(word or "").strip()
+        if not word:
+            continue
+        key = (block_num, par_num, line_num)
+        if line_key is not None and key != line_key:
+            current_lines.append(" ".join(current_words))
+            current_words = []
+            if key[:2] != line_key[:2]:
+                paragraphs.append("\n".join(current_lines))
+                current_lines = []
+        current_words.append(word)
+        line_key = key
+    if current_words:
+        current_lines.append(" ".join(current_words))
+    if current_lines:
+        paragraphs.append("\n".join(current_lines))
+    return "\n\n".join(paragraphs)
+
+
+def compute_readers_ocr_data_conf(data: Dict[str, List[object]]) -> Optional[float]:
+    """Average the non-negative word confidences of an ``image_to_data`` dict."""
+
+    raw = data.get("conf") or []
+    try:
+        values = np.asarray(raw, dtype=np.float64)
+    except (TypeError, ValueError):
+        # Malformed entries: drop the ones that do not parse.
+        parsed: List[float] = []
+        for value in raw:
+            try:
+                parsed.append(float(value))
+            except (TypeError, ValueError):
+                continue
+        values = np.asarray(parsed, dtype=np.float64)
+    values = values[values >= 0]
+    if not values.size:
+        return None
+    return round(float(values.mean()), 2)
+
+
+def open_readers_tess_api(lang: str, psm: int, oem: int):
+    """Return a resident tesserocr engine, or ``None`` to fall back to pytesseract."""
+
+    if tesserocr is None:
+        return None
+    try:
+        return tesserocr.PyTessBaseAPI(lang=lang, psm=int(psm), oem=int(oem))
+    except Exception:
+        return None
+
+
+_TESS_LIMIT_LOCK = threading.Lock()
+_tess_limit_state = {"depth": 0, "owned": False}
+
+
+@contextmanager
+def limit_readers_tesseract_threads() -> Iterator[None]:
+    """Run Tesseract children with one OpenMP thread while the block is active.
+
+    Several concurrent Tesseract processes would otherwise each start one
+    OpenMP thread per core. pytesseract hands its children ``os.environ``, so
+    ``OMP_THREAD_LIMIT=1`` is set there for as long as any OCR pool is open and
+    removed when the last one closes; a limit the user already set is kept.
+    """
+
+    with _TESS_LIMIT_LOCK:
+        if _tess_limit_state["depth"] == 0 and "OMP_THREAD_LIMIT" not in os.environ:
+            os.environ["OMP_THREAD_LIMIT"] = "1"
+            _tess_limit_state["owned"] = True
+        _tess_limit_state["depth"] += 1
+    try:
+        yield
+    finally:
+        with _TESS_LIMIT_LOCK:
+            _tess_limit_state["depth"] -= 1
+            if _tess_limit_state["depth"] == 0 and _tess_limit_state["owned"]:
+                os.environ.pop("OMP_THREAD_LIMIT", None)
+                _tess_limit_state["owned"] = False
+
+
+def get_readers_ocr_page_image(
+    doc,
+    page_number: int,
+    *,
+    dpi: int,
+    pre: Optional[str],
+    dpi_mode: str,
+    max_megapixels: Optional[float] = OCR_MAX_MEGAPIXELS,
+    font_medians: Optional[Dict[int, Optional[float]]] = None,
+) -> Tuple[object, int]:
+    """Render one page for OCR and return ``(image, dpi_used)``; touches PyMuPDF."""
+
+    median = font_medians.get(page_number, _MEDIAN_UNSET) if font_medians else _MEDIAN_UNSET
+    page = doc.load_page(page_number - 1)
+    dpi_used = compute_readers_recommended_dpi(page, default=dpi, mode=dpi_mode, median=median)
+    # Oversized pages (posters, scanned A3) would otherwise rasterise to
+    # hundreds of megapixels; Tesseract time grows with the pixel count.
+    dpi_used = compute_readers_budget_dpi(page, dpi_used, max_megapixels)
+
+    zoom = dpi_used / 72.0
+    mat = fitz.Matrix(zoom, zoom)
+    # Tesseract binarises a grey image anyway; rendering straight to one
+    # channel is a third of the buffer. The preprocessing steps expect colour.
+    colorspace = fitz.csRGB if pre else fitz.csGRAY
+    pix = page.get_pixmap(matrix=mat, colorspace=colorspace, alpha=False)
+    # Wrap the raw samples directly; a PNG encode/decode round-trip costs
+    # a full zlib pass over the page raster in each direction.
+    img = Image.frombytes("L" if pix.n == 1 else "RGB", (pix.width, pix.height), pix.samples)
+    return img, dpi_used
+
+
+def run_readers_ocr_image(
+    img,
+    page_number: int,
+    dpi_used: int,
+    *,
+    lang: str,
+    psm: int,
+    oem: int,
+    pre: Optional[str],
+    save_tsv: bool,
+    outdir: Optional[Path],
+    api=None,
+) -> Dict[str, object]:
+    """Recognise a rendered page image; safe to call from worker threads."""
+
+    if pre:
+        steps = [step for step in pre.split(",") if step.strip()]
+        if steps:
+            try:
+                img = process_readers_preprocess_pipeline(img, steps)
+            except Exception:
+                pass
+
+    config = f"--psm {psm} --oem {oem}"
+    start = time.time()
+    if api is not None:
+        api.SetImage(img)
+        text = (api.GetUTF8Text() or "").strip()
+        avg_conf = round(float(api.MeanTextConf()), 2) if text else None
+    else:
+        data = pytesseract.image_to_data(img, lang=lang, config=config, output_type=pytesseract.Output.DICT)
+        text = compute_readers_ocr_data_text(data)
+        avg_conf = compute_readers_ocr_data_conf(data)
+    elapsed = int((time.time() - start) * 1000)
+
+    try:
+        observe_ocr_time_ms(float(elapsed))
+        if avg_conf is not None:
+            observe_ocr_confidence(float(avg_conf))
+    except Exception:
+        pass
+
+    if save_tsv and outdir is not None:
+        # Debug output only: the TSV rendering costs a second Tesseract pass.
+        if api is not None:
+            tsv = api.GetTSVText(0)
+        else:
+            tsv = pytesseract.image_to_data(img, lang=lang, config=config, output_type=pytesseract.Output.STRING)
+        outdir.mkdir(parents=True, exist_ok=True)
+        (outdir / f"ocr_page_{page_number:03d}.tsv").write_text(tsv, encoding="utf-8")
+
+    return {
+        "page_no": page_number,
+        "mode": "ocr",
+        "text": text,
+        "text_len": len(text),
+        "avg_conf": avg_conf,
+        "tokens": None,
+        "dpi": dpi_used,
+        "oem": oem,
+        "pre": pre,
+        "time_ms": elapsed,
+    }
+
+
+def run_readers_ocr_page(
+    doc,
+    page_number: int,
+    *,
+    lang: str,
+    dpi: int,
+    psm: int,
+    oem: int,
+    pre: Optional[str],
+    save_tsv: bool,
+    outdir: Optional[Path],
+    dpi_mode: str,
+    max_megapixels: Optional[float] = OCR_MAX_MEGAPIXELS,
+    font_medians: Optional[Dict[int, Optional[float]]] = None,
+    api=None,
+) -> Dict[str, object]:
+    """OCR a single page of an open PyMuPDF document.
+
+    ``api`` is an engine from :func:`open_readers_tess_api`; without one each
+    page goes through a pytesseract subprocess. ``font_medians`` holds median
+    font sizes the caller already measured, keyed by page number.
+    """
+
+    img, dpi_used = get_readers_ocr_page_image(
+        doc,
+        page_number,
+        dpi=dpi,
+        pre=pre,
+        dpi_mode=dpi_mode,
+        max_megapixels=max_megapixels,
+        font_medians=font_medians,
+    )
+    return run_readers_ocr_image(
+        img,
+        page_number,
+        dpi_used,
+        lang=lang,
+        psm=psm,
+        oem=oem,
+        pre=pre,
+        save_tsv=save_tsv,
+        outdir=outdir,
+        api=api,
+    )
+
+
+def iter_readers_ocr_pages(
     pdf_path: str,
     *,
     page_numbers_1based: List[int],
@@ -75,121 +365,166 @@ def run_ocr_pages(
     save_tsv: bool = False,
     outdir: Optional[Path] = None,
     dpi_mode: str = "fixed",
-) -> List[Dict[str, object]]:
-    """Run OCR on the requested PDF pages using PyMuPDF + Tesseract."""
-
-    if fitz is None or pytesseract is None or Image is None:
+    max_megapixels: Optional[float] = OCR_MAX_MEGAPIXELS,
+    font_medians: Optional[Dict[int, Optional[float]]] = None,
+    workers: int = 1,
+    ahead: int = 0,
+    doc=None,
+) -> Iterator[Dict[str, object]]:
+    """Yield OCR results for the requested PDF pages in page-list order.
+
+    Pages are rendered on the calling thread, from ``doc`` when the caller
+    already has the document open. With ``workers > 1`` or ``ahead > 0`` the
+    rendered images are recognised on a thread pool, keeping up to
+    ``max(workers, ahead)`` pages in flight while the caller consumes results.
+    """
+
+    if fitz is None or (pytesseract is None and tesserocr is None) or Image is None:
         raise RuntimeError("OCR prerequisites missing: PyMuPDF, PIL, pytesseract")
 
-    doc = fitz.open(pdf_path)
-    results: List[Dict[str, object]] = []
+    render = {"dpi": dpi, "pre": pre, "dpi_mode": dpi_mode, "max_megapixels": max_megapixels, "font_medians": font_medians}
+    recognise = {"lang": lang, "psm": psm, "oem": oem, "pre": pre, "save_tsv": save_tsv, "outdir": outdir}
+    workers = max(1, min(int(workers or 1), len(page_numbers_1based)))
+    window = max(workers, int(ahead or 0)) if workers > 1 or ahead else 0
+    own_doc = doc is None
+    if own_doc:
+        doc = fitz.open(pdf_path)
     try:
-        for page_number in page_numbers_1based:
-            page = doc.load_page(page_number - 1)
-            dpi_used = compute_readers_recommended_dpi(page, default=dpi, mode=dpi_mode)
-
-            zoom = dpi_used / 72.0
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            img = Image.open(io.BytesIO(pix.tobytes("png")))
-
-            if pre:
-                steps = [step for step in pre.split(",") if step.strip()]
-                if steps:
-                    try:
-                        img = process_readers_preprocess_pipeline(img, steps)
-                    except Exception:
-                        pass
-
-            config = f"--psm {psm} --oem {oem}"
-            start = time.time()
-            text = pytesseract.image_to_string(img, lang=lang, config=config) or ""
-            tsv = pytesseract.image_to_data(img, lang=lang, config=config, output_type=pytesseract.Output.STRING)
-            elapsed = int((time.time() - start) * 1000)
-
-            avg_conf = None
+        if not window:
+            api = open_readers_tess_api(lang, psm, oem)
             try:
-                rows = [row for row in tsv.splitlines()[1:] if row.strip()]
-                confidences = []
-                for row in rows:
-                    parts = row.split("\t")
-                    if len(parts) > 10:
-                        try:
-                            value = float(parts[10])
-                        except Exception:
-                            continue
-                        if value >= 0:
-                            confidences.append(value)
-                if confidences:
-                    avg_conf = round(sum(confidences) / len(confidences), 2)
-            except Exception:
-                avg_conf = None
-
-            results.append(
-                {
-                    "page_no": page_number,
-                    "mode": "ocr",
-                    "text": text,
-                    "text_len": len(text),
-                    "avg_conf": avg_conf,
-                    "tokens": None,
-                    "dpi": dpi_used,
-                    "oem": oem,
-                    "pre": pre,
-                    "time_ms": elapsed,
-                }
-            )
+                for page_number in page_numbers_1based:
+                    img, dpi_used = get_readers_ocr_page_image(doc, page_number, **render)
+                    yield run_readers_ocr_image(img, page_number, dpi_used, api=api, **recognise)
+            finally:
+                if api is not None:
+                    api.End()
+            return
+
+        local = threading.local()
+        engines: List[object] = []
+        engines_lock = threading.Lock()
+
+        def _recognise(img, page_number: int, dpi_used: int) -> Dict[str, object]:
+            if not hasattr(local, "api"):
+                local.api = open_readers_tess_api(lang, psm, oem)
+                if local.api is not None:
+                    with engines_lock:
+                        engines.append(local.api)
+            return run_readers_ocr_image(img, page_number, dpi_used, api=local.api, **recognise)
+
+        pending: "deque[Future]" = deque()
+        remaining = iter(page_numbers_1based)
+        # A read-ahead window with a single worker still runs one Tesseract
+        # at a time, which keeps its OpenMP threads.
+        with limit_readers_tesseract_threads() if workers > 1 else nullcontext():
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="readers-ocr-page")
             try:
-                observe_ocr_time_ms(float(elapsed))
-                if avg_conf is not None:
-                    observe_ocr_confidence(float(avg_conf))
-            except Exception:
-                pass
-
-            if save_tsv and outdir is not None:
-                outdir.mkdir(parents=True, exist_ok=True)
-                (outdir / f"ocr_page_{page_number:03d}.tsv").write_text(tsv, encoding="utf-8")
+                while True:
+                    while len(pending) < window:
+                        page_number = next(remaining, None)
+                        if page_number is None:
+                            break
+                        img, dpi_used = get_readers_ocr_page_image(doc, page_number, **render)
+                        pending.append(executor.submit(_recognise, img, page_number, dpi_used))
+                    if not pending:
+                        break
+                    yield pending.popleft().result()
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+                for api in engines:
+                    api.End()
     finally:
-        doc.close()
+        if own_doc:
+            doc.close()
 
-    return results
 
+def run_ocr_pages(
+    pdf_path: str,
+    *,
+    page_numbers_1based: List[int],
+    lang: str = "deu+eng",
+    dpi: int = 300,
+    psm: int = 3,
+    oem: int = 1,
+    pre: Optional[str] = None,
+    save_tsv: bool = False,
+    outdir: Optional[Path] = None,
+    dpi_mode: str = "fixed",
+    max_megapixels: Optional[float] = OCR_MAX_MEGAPIXELS,
+    font_medians: Optional[Dict[int, Optional[float]]] = None,
+    workers: int = 1,
+) -> List[Dict[str, object]]:
+    """Run OCR on the requested PDF pages using PyMuPDF + Tesseract."""
 
-def run_pdf_ocr(orchestrator, pdf_path: Path, pages: List[int]) -> Dict[int, Dict[str, object]]:
-    """Run OCR for orchestrator integration, returning a page lookup."""
-
-    try:
-        debug_dir = orchestrator.readers_dir / "ocr_debug" if orchestrator.opts.verbose else None
-        pre_config = "deskew,clahe" if orchestrator.opts.use_pre else None
-        start = time.perf_counter()
-        results = run_ocr_pages(
-            str(pdf_path),
-            page_numbers_1based=pages,
-            lang=orchestrator.opts.lang,
-            dpi=orchestrator.opts.dpi,
-            psm=orchestrator.opts.psm,
-            oem=orchestrator.opts.oem,
-            pre=pre_config,
-            save_tsv=orchestrator.opts.verbose,
-            outdir=debug_dir,
-            dpi_mode=orchestrator.opts.dpi_mode,
+    return list(
+        iter_readers_ocr_pages(
+            pdf_path,
+            page_numbers_1based=page_numbers_1based,
+            lang=lang,
+            dpi=dpi,
+            psm=psm,
+            oem=oem,
+            pre=pre,
+            save_tsv=save_tsv,
+            outdir=outdir,
+            dpi_mode=dpi_mode,
+            max_megapixels=max_megapixels,
+            font_medians=font_medians,
+            workers=workers,
         )
-        orchestrator._timings["ocr"] += (time.perf_counter() - start) * 1000.0
-    except RuntimeError as exc:
+    )
+
+
+def compute_readers_ocr_kwargs(orchestrator) -> Dict[str, object]:
+    return {
+        "lang": orchestrator.opts.lang,
+        "dpi": orchestrator.opts.dpi,
+        "psm": orchestrator.opts.psm,
+        "oem": orchestrator.opts.oem,
+        "pre": "deskew,clahe" if orchestrator.opts.use_pre else None,
+        "save_tsv": orchestrator.opts.verbose,
+        "outdir": orchestrator.readers_dir / "ocr_debug" if orchestrator.opts.verbose else None,
+        "dpi_mode": orchestrator.opts.dpi_mode,
+        "max_megapixels": getattr(orchestrator.opts, "max_megapixels", OCR_MAX_MEGAPIXELS),
+        "workers": compute_readers_ocr_page_workers(getattr(orchestrator.opts, "workers", None)),
+    }
+
+
+def record_readers_ocr_failure(orchestrator, pages: List[int], exc: BaseException) -> None:
+    if isinstance(exc, RuntimeError):
         orchestrator._log_warning("ocr_unavailable")
         orchestrator._log_tool_event(
             "ocr_runner",
             "unavailable",
             details={"reason": str(exc)},
         )
-        return {}
+        return
+    orchestrator._log_warning(f"ocr_runner_error:{exc}")
+    orchestrator._log_tool_event(
+        "ocr_runner",
+        "error",
+        details={"error": str(exc), "pages": pages},
+    )
+
+
+def record_readers_ocr_success(orchestrator, pages: List[int], lookup: Dict[int, Dict[str, object]]) -> None:
+    status = "ok" if lookup else "empty"
+    details = {"pages": pages, "covered": sorted(lookup.keys()), "lang": orchestrator.opts.lang}
+    if orchestrator.opts.use_pre:
+        details["pre"] = "deskew,clahe"
+    orchestrator._log_tool_event("ocr_runner", status, details=details)
+
+
+def run_pdf_ocr(orchestrator, pdf_path: Path, pages: List[int]) -> Dict[int, Dict[str, object]]:
+    """Run OCR for orchestrator integration, returning a page lookup."""
+
+    try:
+        start = time.perf_counter()
+        results = run_ocr_pages(str(pdf_path), page_numbers_1based=pages, **compute_readers_ocr_kwargs(orchestrator))
+        orchestrator._timings.ocr += (time.perf_counter() - start) * 1000.0
     except Exception as exc:  # pragma: no cover - external OCR errors
-        orchestrator._log_warning(f"ocr_runner_error:{exc}")
-        orchestrator._log_tool_event(
-            "ocr_runner",
-            "error",
-            details={"error": str(exc), "pages": pages},
-        )
+        record_readers_ocr_failure(orchestrator, pages, exc)
         return {}
 
     lookup: Dict[int, Dict[str, object]] = {}
@@ -197,15 +532,87 @@ def run_pdf_ocr(orchestrator, pdf_path: Path, pages: List[int]) -> Dict[int, Dic
         page_no = int(item.get("page_no", 0) or 0)
         if page_no > 0:
             lookup[page_no] = item
-
-    status = "ok" if lookup else "empty"
-    details = {"pages": pages, "covered": sorted(lookup.keys()), "lang": orchestrator.opts.lang}
-    if orchestrator.opts.use_pre:
-        details["pre"] = "deskew,clahe"
-    orchestrator._log_tool_event("ocr_runner", status, details=details)
+    record_readers_ocr_success(orchestrator, pages, lookup)
     return lookup
 
 
+class ReadersPdfOcrStream:
+    """Hand out page OCR results in page order while Tesseract runs ahead.
+
+    Rendering happens inside :meth:`get`, on the consumer's thread and from
+    the consumer's own document, so PyMuPDF is never entered concurrently.
+    The rendered images are recognised on a thread pool, up to ``maxsize``
+    pages ahead, while the consumer merges, blocks and collects tables for
+    the pages that are already done.
+    """
+
+    def __init__(
+        self,
+        orchestrator,
+        pdf_path: Path,
+        pages: List[int],
+        *,
+        maxsize: int = 4,
+        font_medians: Optional[Dict[int, Optional[float]]] = None,
+        doc=None,
+    ) -> None:
+        self._orchestrator = orchestrator
+        self._pages = list(pages)
+        kwargs = compute_readers_ocr_kwargs(orchestrator)
+        kwargs["font_medians"] = font_medians
+        self._error: Optional[BaseException] = None
+        self._done = False
+        self.lookup: Dict[int, Dict[str, object]] = {}
+        self._elapsed_ms = 0.0
+        self._results = iter_readers_ocr_pages(
+            str(pdf_path),
+            page_numbers_1based=self._pages,
+            ahead=maxsize,
+            doc=doc,
+            **kwargs,
+        )
+
+    def _pull(self) -> None:
+        # Counts rendering plus any wait on Tesseract, not the overlapped work.
+        start = time.perf_counter()
+        try:
+            item = next(self._results)
+        except StopIteration:
+            self._done = True
+            return
+        except Exception as exc:  # pragma: no cover - external OCR errors
+            self._error = exc
+            self._done = True
+            return
+        finally:
+            self._elapsed_ms += (time.perf_counter() - start) * 1000.0
+        page_no = int(item.get("page_no", 0) or 0)
+        if page_no > 0:
+            self.lookup[page_no] = item
+
+    def get(self, page_no: int) -> Optional[Dict[str, object]]:
+        """Block until ``page_no`` has been OCR'd (or the stream ended)."""
+
+        while page_no not in self.lookup and not self._done:
+            self._pull()
+        return self.lookup.get(page_no)
+
+    def close(self, *, cancel: bool = False) -> Dict[int, Dict[str, object]]:
+        """Finish (or cancel) the remaining pages, record timings and the tool event."""
+
+        if cancel:
+            self._results.close()
+            self._done = True
+        while not self._done:
+            self._pull()
+        if self._error is not None:
+            record_readers_ocr_failure(self._orchestrator, self._pages, self._error)
+        else:
+            self._orchestrator._timings.ocr += self._elapsed_ms
+            record_readers_ocr_success(self._orchestrator, self._pages, self.lookup)
+        return self.lookup
+
+
 def process_readers_ocr_result(fallback_text: str, ocr_data: Optional[Dict[str, object]]) -> Tuple[str, float, int, float]:
     """Translate a raw OCR payload into text, confidence, word count, and timing."""
 
@@ -237,7 +644,19 @@ def process_readers_merge_text(native_text: str, ocr_text: str, native_conf: flo
 
 
 __all__ = [
+    "OCR_MAX_MEGAPIXELS",
+    "ReadersPdfOcrStream",
+    "compute_readers_budget_dpi",
+    "compute_readers_median_font_size_from_dict",
+    "compute_readers_ocr_data_conf",
+    "compute_readers_ocr_data_text",
+    "get_readers_ocr_page_image",
+    "iter_readers_ocr_pages",
+    "limit_readers_tesseract_threads",
+    "open_readers_tess_api",
     "run_ocr_pages",
+    "run_readers_ocr_image",
+    "run_readers_ocr_page",
     "run_pdf_ocr",
     "process_readers_ocr_result",
     "process_readers_merge_text",
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 """Table extraction helpers backed by OpenCV."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -20,6 +22,13 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     pytesseract = None
 
+from .readers_core_ocr import limit_readers_tesseract_threads
+
+CELL_OCR_PARALLEL_MIN = 8
+CELL_OCR_MAX_WORKERS = 8
+CELL_INK_MIN_PIXELS = 5
+CELL_INK_MIN_RATIO = 0.002
+
 
 def validate_readers_cv2_dependency() -> None:
     if cv2 is None:  # pragma: no cover
@@ -47,15 +56,14 @@ def compute_readers_dynamic_kernels(width: int, height: int, sensitivity: str) -
     return max(10, width // scale), max(10, height // scale)
 
 
-def compute_readers_line_maps(binarized: np.ndarray, sensitivity: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+def compute_readers_line_maps(binarized: np.ndarray, sensitivity: str) -> Tuple[np.ndarray, np.ndarray]:
     h, w = binarized.shape[:2]
     hor_k, ver_k = compute_readers_dynamic_kernels(w, h, sensitivity)
     kernel_h = cv2.getStructuringElement(cv2.MORPH_RECT, (hor_k, 1))
     kernel_v = cv2.getStructuringElement(cv2.MORPH_RECT, (1, ver_k))
     horiz = cv2.dilate(cv2.erode(binarized, kernel_h, iterations=1), kernel_h, iterations=1)
     vert = cv2.dilate(cv2.erode(binarized, kernel_v, iterations=1), kernel_v, iterations=1)
-    grid = cv2.add(horiz, vert)
-    return horiz, vert, grid
+    return horiz, vert
 
 
 def compute_readers_project_peaks(img: np.ndarray, axis: int, min_gap: int = 5) -> List[int]:
@@ -87,6 +95,15 @@ def process_readers_crop_cell(img: np.ndarray, y1: int, y2: int, x1: int, x2: in
     return img[y1p:y2p, x1p:x2p]
 
 
+def check_readers_cell_has_ink(cell_bin: np.ndarray) -> bool:
+    """Return True when a binarized cell carries enough foreground to be worth OCR."""
+
+    if cell_bin.size == 0:
+        return False
+    threshold = max(CELL_INK_MIN_PIXELS, int(CELL_INK_MIN_RATIO * cell_bin.size))
+    return cv2.countNonZero(cell_bin) >= threshold
+
+
 def process_readers_ocr_cell(img: np.ndarray, lang: str) -> str:
     if pytesseract is None:
         return ""
@@ -96,6 +113,19 @@ def process_readers_ocr_cell(img: np.ndarray, lang: str) -> str:
         return ""
 
 
+def process_readers_ocr_cells(cells: List[np.ndarray], lang: str) -> List[str]:
+    """OCR cropped cells in order, fanning out to threads for larger tables."""
+
+    if len(cells) < CELL_OCR_PARALLEL_MIN:
+        return [process_readers_ocr_cell(cell, lang=lang) for cell in cells]
+    workers = min(CELL_OCR_MAX_WORKERS, os.cpu_count() or 1, len(cells))
+    if workers == 1:
+        return [process_readers_ocr_cell(cell, lang=lang) for cell in cells]
+    # Same OpenMP limit as the page pool: one thread per concurrent Tesseract.
+    with limit_readers_tesseract_threads(), ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda cell: process_readers_ocr_cell(cell, lang=lang), cells))
+
+
 def validate_readers_safe_mkdir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
@@ -109,8 +139,13 @@ def extract_tables_from_image(
     page_tag: Optional[str] = None,
     allow_borderless: bool = True,
     ocr_cells: bool = True,
+    gray: Optional[np.ndarray] = None,
 ) -> Tuple[List[List[str]], Dict[str, float], Dict[str, Any]]:
-    """Detect a simple table grid and return the extracted cell text."""
+    """Detect a simple table grid and return the extracted cell text.
+
+    Callers that already hold a grayscale plane can pass it as ``gray`` to skip
+    the colour conversion.
+    """
 
     validate_readers_cv2_dependency()
 
@@ -121,9 +156,13 @@ def extract_tables_from_image(
         if page_tag:
             validate_readers_safe_mkdir(export_root / "tables_pages")
 
-    gray = process_readers_to_gray(img)
+    if gray is None:
+        gray = process_readers_to_gray(img)
     binarized = process_readers_binarize_image(gray)
-    horiz, vert, _ = compute_readers_line_maps(binarized, sensitivity=sensitivity)
+    if export_root is None:
+        # The colour image is only needed for debug exports; release it early.
+        del img
+    horiz, vert = compute_readers_line_maps(binarized, sensitivity=sensitivity)
 
     def compute_readers_empty_metadata(metadata: Dict[str, float]) -> Tuple[List[List[str]], Dict[str, float], Dict[str, Any]]:
         geometry: Dict[str, Any] = {
@@ -192,10 +231,12 @@ def extract_tables_from_image(
             "avg_cell_area": 0.0,
         })
 
-    span_height = float(row_lines[-1] - row_lines[0]) if row_count else 0.0
-    span_width = float(col_lines[-1] - col_lines[0]) if col_count else 0.0
-    avg_cell_height = span_height / row_count if row_count else 0.0
-    avg_cell_width = span_width / col_count if col_count else 0.0
+    row_arr = np.asarray(row_lines, dtype=np.int32)
+    col_arr = np.asarray(col_lines, dtype=np.int32)
+    avg_cell_height = float(np.diff(row_arr).mean())
+    avg_cell_width = float(np.diff(col_arr).mean())
+    row_spans = np.stack([row_arr[:-1], row_arr[1:]], axis=1).tolist()
+    col_spans = np.stack([col_arr[:-1], col_arr[1:]], axis=1).tolist()
     metrics: Dict[str, float] = {
         "rows": float(row_count),
         "cols": float(col_count),
@@ -205,18 +246,25 @@ def extract_tables_from_image(
         "avg_cell_area": avg_cell_height * avg_cell_width,
     }
 
-    rows_text: List[List[str]] = []
-    for r_index in range(row_count):
-        y1, y2 = row_lines[r_index], row_lines[r_index + 1]
-        row_cells: List[str] = []
-        for c_index in range(col_count):
-            x1, x2 = col_lines[c_index], col_lines[c_index + 1]
-            cell = process_readers_crop_cell(gray, y1, y2, x1, x2, pad=1)
-            if cell.size == 0 or not ocr_cells:
-                row_cells.append("")
-            else:
-                row_cells.append(process_readers_ocr_cell(cell, lang=lang))
-        rows_text.append(row_cells)
+    rows_text: List[List[str]] = [[""] * col_count for _ in range(row_count)]
+    jobs: List[Tuple[int, int, np.ndarray]] = []
+    if ocr_cells:
+        # Ink test on the page without its ruling: every padded crop still
+        # holds part of the blurred grid line, which would count as ink.
+        ink = cv2.subtract(binarized, cv2.bitwise_or(horiz, vert))
+        for r_index, (y1, y2) in enumerate(row_spans):
+            for c_index, (x1, x2) in enumerate(col_spans):
+                cell_bin = process_readers_crop_cell(ink, y1, y2, x1, x2, pad=1)
+                if not check_readers_cell_has_ink(cell_bin):
+                    continue
+                cell = process_readers_crop_cell(gray, y1, y2, x1, x2, pad=1)
+                if cell.size:
+                    jobs.append((r_index, c_index, cell))
+
+    if jobs:
+        texts = process_readers_ocr_cells([cell for _, _, cell in jobs], lang=lang)
+        for (r_index, c_index, _), text in zip(jobs, texts):
+            rows_text[r_index][c_index] = text
 
     if export_root is not None:
         try:
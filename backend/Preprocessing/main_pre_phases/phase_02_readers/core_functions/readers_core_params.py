@@ -49,6 +49,8 @@ def get_readers_options(
         psm=params.get("psm", config_options.get("psm", 6)),
         oem=int(overrides.get("oem", config_options.get("oem", 3))),
         workers=int(overrides.get("workers", config_options.get("workers", 4))),
+        file_workers=int(overrides.get("file_workers", config_options.get("file_workers", 1))),
+        max_megapixels=float(overrides.get("max_megapixels", config_options.get("max_megapixels", 30.0))),
         use_pre=bool(overrides.get("use_pre", config_options.get("use_pre", False))),
         export_xlsx=bool(overrides.get("export_xlsx", config_options.get("export_xlsx", False))),
         verbose=bool(overrides.get("verbose", config_options.get("verbose", False))),
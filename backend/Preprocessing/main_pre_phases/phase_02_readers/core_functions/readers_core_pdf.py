@@ -12,6 +12,40 @@ except Exception as exc:  # pragma: no cover - optional dependency
 else:
     FITZ_IMPORT_ERROR = None
 
+if fitz is not None:
+    try:
+        # MuPDF still records problems in TOOLS.mupdf_warnings(); printing each
+        # one to stderr only costs time on damaged documents.
+        fitz.TOOLS.mupdf_display_errors(False)
+    except Exception:  # pragma: no cover - older PyMuPDF
+        pass
+
+# The "dict" flags are a superset of the "text" ones (they only add images), so
+# one TextPage built with them serves both extractions unchanged.
+PDF_TEXTPAGE_FLAGS = fitz.TEXTFLAGS_DICT if fitz is not None else None
+
+
+def open_readers_pdf_textpage(page):
+    """Parse ``page`` once into a TextPage reusable across ``get_text`` calls."""
+
+    if PDF_TEXTPAGE_FLAGS is None:
+        return None
+    try:
+        return page.get_textpage(flags=PDF_TEXTPAGE_FLAGS)
+    except Exception:
+        return None
+
+
+def release_readers_pdf_store() -> None:
+    """Drop MuPDF's cached fonts, images and display lists after a document is done."""
+
+    if fitz is None:
+        return
+    try:
+        fitz.TOOLS.store_shrink(100)
+    except Exception:  # pragma: no cover - defensive
+        pass
+
 
 def get_pdf_text(path: str, max_pages: Optional[int] = None) -> str:
     """Return concatenated text extracted from a PDF using PyMuPDF."""
@@ -40,4 +74,4 @@ def get_readers_pdf_text(path: str) -> str:
     return get_pdf_text(path)
 
 
-__all__ = ["get_pdf_text", "get_readers_pdf_text"]
+__all__ = ["PDF_TEXTPAGE_FLAGS", "get_pdf_text", "get_readers_pdf_text", "open_readers_pdf_textpage", "release_readers_pdf_store"]
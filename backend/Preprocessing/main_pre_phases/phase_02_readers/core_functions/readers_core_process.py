@@ -2,7 +2,6 @@ from __future__ import annotations
 
 """Core processing for the readers stage."""
 
-import json
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Sequence
@@ -11,6 +10,7 @@ from ..pipeline_workflow.readers_pipeline_main import ReadersOrchestrator
 from ..outputs.readers_output_builder import compute_readers_doc_meta
 
 from ..core_functions.readers_core_params import compute_readers_params, get_readers_options
+from ..internal_helpers.readers_helper_json import save_readers_json
 from ..connecters.readers_connector_metadata import (
     compute_readers_run_metadata,
     get_readers_detect_meta,
@@ -114,10 +114,7 @@ def process_readers_segment(
 
         try:
             _io_t0 = time.perf_counter()
-            (file_outdir / "doc_meta.json").write_text(
-                json.dumps(doc_meta, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+            save_readers_json(doc_meta, file_outdir / "doc_meta.json")
             observe_io_duration("write", "readers_doc_meta", (time.perf_counter() - _io_t0) * 1000.0)
         except Exception:
             record_io_error("write", "readers_doc_meta")
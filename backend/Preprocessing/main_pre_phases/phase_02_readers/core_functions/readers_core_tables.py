@@ -193,9 +193,9 @@ def process_readers_collect_tables(
     except Exception as exc:
         elapsed = (time.perf_counter() - start_extract) * 1000.0
         if detect_only:
-            orchestrator._timings["table_detect"] += elapsed
+            orchestrator._timings.table_detect += elapsed
         else:
-            orchestrator._timings["table_extract"] += elapsed
+            orchestrator._timings.table_extract += elapsed
         orchestrator._log_warning(f"table_extract_error:p{page_no}:{exc}")
         tool = "ocr" if "ocr" in (decision or "").lower() else "camelot"
         process_readers_append_table_raw(orchestrator, page_no, tool, "failed")
@@ -203,9 +203,9 @@ def process_readers_collect_tables(
 
     elapsed = (time.perf_counter() - start_extract) * 1000.0
     if detect_only:
-        orchestrator._timings["table_detect"] += elapsed
+        orchestrator._timings.table_detect += elapsed
     else:
-        orchestrator._timings["table_extract"] += elapsed
+        orchestrator._timings.table_extract += elapsed
 
     geometry = geometry or {}
     geometry.setdefault("row_lines", [])
@@ -290,6 +290,7 @@ def process_readers_collect_tables(
 
     table_record = TableRecord(file=str(pdf_path), page=page_no, rows=rows, decision=decision, metrics=metrics_clean)
     orchestrator._tables.append(table_record)
+    orchestrator._tables_cells_total += sum(len(row) for row in rows)
     orchestrator._table_flags.add(page_no)
     orchestrator._table_candidates[page_no] = metrics_clean
 
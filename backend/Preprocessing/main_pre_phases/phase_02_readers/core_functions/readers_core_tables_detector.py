@@ -2,10 +2,10 @@ from __future__ import annotations
 
 """Lightweight table candidate collector for the readers runtime."""
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
+from ..internal_helpers.readers_helper_json import save_readers_jsonl
 from ..schemas.readers_schema_settings import get_runtime_settings
 
 SETTINGS = get_runtime_settings()
@@ -14,6 +14,36 @@ IMAGE_MORPH_ENABLED = bool(SETTINGS.features.get("image_morph_detection", True))
 TEXT_ALIGNMENT_ENABLED = bool(SETTINGS.features.get("text_alignment_detection", True))
 
 
+def compute_readers_bbox_or_default(bbox: Optional[Iterable[float]], fallback: Iterable[float]) -> List[float]:
+    if bbox:
+        # Fast path: almost every caller passes a clean four-number box.
+        try:
+            b0, b1, b2, b3 = bbox
+            return [round(float(b0), 3), round(float(b1), 3), round(float(b2), 3), round(float(b3), 3)]
+        except Exception:
+            pass
+    source = list(bbox) if bbox else list(fallback)
+    if len(source) != 4:
+        source = list(fallback)
+    cleaned: List[float] = []
+    for value in source[:4]:
+        try:
+            cleaned.append(round(float(value), 3))
+        except Exception:
+            cleaned.append(0.0)
+    if len(cleaned) < 4:
+        cleaned.extend([0.0] * (4 - len(cleaned)))
+    return cleaned
+
+
+def check_readers_bbox_intersects(a: List[float], b: List[float]) -> bool:
+    if len(a) < 4 or len(b) < 4:
+        return False
+    ax0, ay0, ax1, ay1 = a
+    bx0, by0, bx1, by1 = b
+    return not (ax1 <= bx0 or bx1 <= ax0 or ay1 <= by0 or by1 <= ay0)
+
+
 class LightTableDetector:
     """Collect lightweight table candidates and persist them to JSONL."""
 
@@ -26,11 +56,10 @@ class LightTableDetector:
 
     def process_readers_reset_light_tables(self) -> None:
         self._candidates = []
-        if self._path.exists():
-            try:
-                self._path.unlink()
-            except Exception:
-                pass
+        try:
+            self._path.unlink(missing_ok=True)
+        except OSError:
+            pass
 
     @staticmethod
     def compute_readers_light_clamp_confidence(value: float) -> float:
@@ -74,28 +103,8 @@ class LightTableDetector:
             cues.append("layout")
         return cues
 
-    @staticmethod
-    def compute_readers_bbox_or_default(bbox: Optional[Iterable[float]], fallback: Iterable[float]) -> List[float]:
-        source = list(bbox) if bbox else list(fallback)
-        if len(source) != 4:
-            source = list(fallback)
-        cleaned: List[float] = []
-        for value in source[:4]:
-            try:
-                cleaned.append(round(float(value), 3))
-            except Exception:
-                cleaned.append(0.0)
-        if len(cleaned) < 4:
-            cleaned.extend([0.0] * (4 - len(cleaned)))
-        return cleaned
-
-    @staticmethod
-    def check_readers_bbox_intersects(a: List[float], b: List[float]) -> bool:
-        if len(a) < 4 or len(b) < 4:
-            return False
-        ax0, ay0, ax1, ay1 = a
-        bx0, by0, bx1, by1 = b
-        return not (ax1 <= bx0 or bx1 <= ax0 or ay1 <= by0 or by1 <= ay0)
+    compute_readers_bbox_or_default = staticmethod(compute_readers_bbox_or_default)
+    check_readers_bbox_intersects = staticmethod(check_readers_bbox_intersects)
 
     def record_readers_light_candidate(
         self,
@@ -130,15 +139,15 @@ class LightTableDetector:
         cues = self.compute_readers_light_cues(rows, cols, gridlines_h, gridlines_v)
         confidence = self.compute_readers_light_confidence(status, rows, cols, cell_count)
 
-        page_box = self.compute_readers_bbox_or_default(page_bbox, [0.0, 0.0, 0.0, 0.0])
-        bbox = self.compute_readers_bbox_or_default(table_bbox, page_box)
+        page_box = compute_readers_bbox_or_default(page_bbox, [0.0, 0.0, 0.0, 0.0])
+        bbox = compute_readers_bbox_or_default(table_bbox, page_box)
 
         overlaps = False
         for block in text_blocks or []:
             block_bbox = block.get("bbox")
             if isinstance(block_bbox, list):
-                block_box = self.compute_readers_bbox_or_default(block_bbox, [0.0, 0.0, 0.0, 0.0])
-                if self.check_readers_bbox_intersects(bbox, block_box):
+                block_box = compute_readers_bbox_or_default(block_bbox, [0.0, 0.0, 0.0, 0.0])
+                if check_readers_bbox_intersects(bbox, block_box):
                     overlaps = True
                     break
 
@@ -162,10 +171,7 @@ class LightTableDetector:
         self._candidates.append(candidate)
 
     def emit_readers_light_candidates(self) -> None:
-        self.readers_dir.mkdir(parents=True, exist_ok=True)
-        with self._path.open("w", encoding="utf-8") as handle:
-            for candidate in self._candidates:
-                handle.write(json.dumps(candidate, ensure_ascii=False) + "\n")
+        save_readers_jsonl(self._candidates, self._path)
 
 
 ReadersLightTableDetector = LightTableDetector
@@ -173,36 +179,6 @@ ReadersLightTableDetector = LightTableDetector
 __all__ = ["LightTableDetector", "ReadersLightTableDetector"]
 
 
-
-
-
-
-\
-
-
-# Backwards-compatible aliases
-LightTableDetector.reset = LightTableDetector.process_readers_reset_light_tables
-LightTableDetector.add_candidate = LightTableDetector.record_readers_light_candidate
-LightTableDetector.flush = LightTableDetector.emit_readers_light_candidates
-LightTableDetector._clamp_confidence = LightTableDetector.compute_readers_light_clamp_confidence
-LightTableDetector._compute_confidence = LightTableDetector.compute_readers_light_confidence
-LightTableDetector._compute_cues = LightTableDetector.compute_readers_light_cues
-LightTableDetector._bbox_or_default = LightTableDetector.compute_readers_bbox_or_default
-LightTableDetector._bbox_intersects = LightTableDetector.check_readers_bbox_intersects
-
-
-
-# Backwards-compatible aliases
-LightTableDetector.reset = LightTableDetector.process_readers_reset_light_tables
-LightTableDetector.add_candidate = LightTableDetector.record_readers_light_candidate
-LightTableDetector.flush = LightTableDetector.emit_readers_light_candidates
-LightTableDetector._clamp_confidence = LightTableDetector.compute_readers_light_clamp_confidence
-LightTableDetector._compute_confidence = LightTableDetector.compute_readers_light_confidence
-LightTableDetector._compute_cues = LightTableDetector.compute_readers_light_cues
-LightTableDetector._bbox_or_default = LightTableDetector.compute_readers_bbox_or_default
-LightTableDetector._bbox_intersects = LightTableDetector.check_readers_bbox_intersects
-
-
 # Backwards-compatible aliases
 LightTableDetector.reset = LightTableDetector.process_readers_reset_light_tables
 LightTableDetector.add_candidate = LightTableDetector.record_readers_light_candidate
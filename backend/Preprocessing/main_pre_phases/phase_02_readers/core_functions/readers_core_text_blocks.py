@@ -2,7 +2,6 @@ from __future__ import annotations
 
 """Core business logic for text block processing in the readers stage."""
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
@@ -12,6 +11,7 @@ from backend.Preprocessing.main_pre_helpers.main_pre_helpers_lang import collaps
 from backend.Preprocessing.main_pre_helpers.main_pre_helpers_num import as_float, as_int
 
 from ..schemas.readers_schema_types import TextBlock
+from ..internal_helpers.readers_helper_json import load_readers_json
 
 JsonDict = Dict[str, Any]
 
@@ -184,13 +184,13 @@ def compute_readers_text_blocks(
 
     geometry_lookup = page_geometry or {}
     blocks: List[TextBlock] = []
-    with path.open("r", encoding="utf-8") as handle:
+    with path.open("rb") as handle:
         for index, raw_line in enumerate(handle):
             line = raw_line.strip()
             if not line:
                 continue
             try:
-                item: JsonDict = json.loads(line)
+                item: JsonDict = load_readers_json(line)
             except Exception:
                 continue
             if not isinstance(item, dict):
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+"""JSON serialization helpers for readers artifacts.
+
+Uses ``orjson`` when it is installed and falls back to the standard library
+otherwise; the implementation is chosen once at import time.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, List
+
+try:  # Optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - orjson not installed
+    orjson = None
+
+
+if orjson is not None:
+    _OPTS_COMPACT = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _OPTS_INDENT = _OPTS_COMPACT | orjson.OPT_INDENT_2
+
+    def dump_readers_json_bytes(payload: Any, *, indent: bool = False) -> bytes:
+        """Serialize ``payload`` to UTF-8 encoded JSON."""
+
+        return orjson.dumps(payload, option=_OPTS_INDENT if indent else _OPTS_COMPACT)
+
+    load_readers_json = orjson.loads
+
+else:  # pragma: no cover - exercised only without orjson
+    _ENCODER_COMPACT = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    _ENCODER_INDENT = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+    def dump_readers_json_bytes(payload: Any, *, indent: bool = False) -> bytes:
+        """Serialize ``payload`` to UTF-8 encoded JSON."""
+
+        return (_ENCODER_INDENT if indent else _ENCODER_COMPACT).encode(payload).encode("utf-8")
+
+    load_readers_json = json.loads
+
+
+JSONL_BATCH_SIZE = 1024
+JSONL_BUFFER_SIZE = 1 << 20
+
+
+def save_readers_json(payload: Any, destination: Path, *, indent: bool = True) -> None:
+    """Write ``payload`` as JSON to ``destination``, creating parent folders."""
+
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is None:  # pragma: no cover - exercised only without orjson
+        # Stream encoder chunks instead of building the whole document as one str.
+        encoder = _ENCODER_INDENT if indent else _ENCODER_COMPACT
+        with open(destination, "w", encoding="utf-8", buffering=JSONL_BUFFER_SIZE) as handle:
+            handle.writelines(encoder.iterencode(payload))
+        return
+    destination.write_bytes(dump_readers_json_bytes(payload, indent=indent))
+
+
+def save_readers_jsonl(rows: Iterable[Any], destination: Path) -> None:
+    """Write ``rows`` as JSON Lines, serializing and flushing in batches."""
+
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    batch: List[bytes] = []
+    append = batch.append
+    dumps = dump_readers_json_bytes
+    with open(destination, "wb", buffering=JSONL_BUFFER_SIZE) as handle:
+        write = handle.write
+        for row in rows:
+            append(dumps(row))
+            if len(batch) >= JSONL_BATCH_SIZE:
+                batch.append(b"")
+                write(b"\n".join(batch))
+                batch.clear()
+        if batch:
+            batch.append(b"")
+            write(b"\n".join(batch))
+
+
+__all__ = [
+    "JSONL_BATCH_SIZE",
+    "JSONL_BUFFER_SIZE",
+    "dump_readers_json_bytes",
+    "load_readers_json",
+    "save_readers_json",
+    "save_readers_jsonl",
+]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+"""Plain-text artifact writers for the readers runtime."""
+
+import os
+from pathlib import Path
+from typing import Iterable, List, Sequence
+
+WRITEV_MAX_IOV = 512
+
+
+def _write_readers_iov(fd: int, chunks: List[bytes]) -> None:
+    """Write every chunk with ``os.writev``, resuming after short writes."""
+
+    while chunks:
+        written = os.writev(fd, chunks)
+        while chunks and written >= len(chunks[0]):
+            written -= len(chunks[0])
+            chunks.pop(0)
+        if chunks and written:
+            chunks[0] = chunks[0][written:]
+
+
+def save_readers_text_parts(parts: Sequence[str], destination: Path) -> None:
+    """Write ``parts`` back to back as UTF-8 text to ``destination``."""
+
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    encoded = [part.encode("utf-8") for part in parts if part]
+    if not hasattr(os, "writev"):  # pragma: no cover - Windows
+        with open(destination, "wb") as handle:
+            handle.writelines(encoded)
+        return
+    fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        for start in range(0, len(encoded), WRITEV_MAX_IOV):
+            _write_readers_iov(fd, encoded[start:start + WRITEV_MAX_IOV])
+    finally:
+        os.close(fd)
+
+
+def process_readers_text_readahead(paths: Iterable[Path]) -> int:
+    """Ask the kernel to start reading ``paths`` in the background.
+
+    One ``POSIX_FADV_WILLNEED`` hint per file lets the block layer queue all
+    reads up front, so the sequential readers later find them in the page
+    cache. Returns the number of files hinted; a no-op where unsupported.
+    """
+
+    if not hasattr(os, "posix_fadvise"):  # pragma: no cover - non-POSIX
+        return 0
+    hinted = 0
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            hinted += 1
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return hinted
+
+
+__all__ = ["WRITEV_MAX_IOV", "process_readers_text_readahead", "save_readers_text_parts"]
@@ -39,6 +39,7 @@ def get_readers_cli_arguments() -> argparse.Namespace:
     parser.add_argument("--blocks-threshold", type=int, default=int(_BASE_OPTIONS.get("blocks_threshold", 3)))
     parser.add_argument("--oem", type=int, default=int(_BASE_OPTIONS.get("oem", 3)))
     parser.add_argument("--workers", type=int, default=int(_BASE_OPTIONS.get("workers", 4)))
+    parser.add_argument("--file-workers", type=int, default=int(_BASE_OPTIONS.get("file_workers", 1)))
     parser.add_argument("--pre", action="store_true", default=bool(_BASE_OPTIONS.get("use_pre", False)))
     parser.add_argument("--export-xlsx", action="store_true", default=bool(_BASE_OPTIONS.get("export_xlsx", False)))
     parser.add_argument("--verbose", action="store_true", default=bool(_BASE_OPTIONS.get("verbose", False)))
@@ -75,6 +76,7 @@ def get_readers_cli_overrides(args: argparse.Namespace) -> Dict[str, Any]:
             "tables_mode": args.tables_default,
             "oem": args.oem,
             "workers": args.workers,
+            "file_workers": args.file_workers,
             "use_pre": bool(args.pre),
             "export_xlsx": bool(args.export_xlsx),
             "verbose": bool(args.verbose),
@@ -2,22 +2,30 @@ from __future__ import annotations
 """Runtime orchestrator for the readers pipeline stage."""
 from pathlib import Path
 from collections import defaultdict
-import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import math
+import os
 import time
 import re
-from dataclasses import asdict
-from typing import Any, Dict, List, Optional, Tuple, Set
+from dataclasses import asdict, replace
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Set
+
+import numpy as np
 
 from core.versioning import make_artifact_stamp
 
-from ..schemas.readers_schema_models import Summary, PageRecord, TableRecord
+from ..schemas.readers_schema_models import Summary, PageRecord, ReadersTimings, TableRecord
 from ..schemas.readers_schema_options import ReaderOptions
 from ..schemas.readers_schema_settings import get_runtime_settings
 from backend.Preprocessing.main_pre_helpers.main_pre_helpers_lang_detect import (
+    compute_language_and_locale_hint,
     compute_language_hint,
     compute_locale_hint,
     compute_merged_language_hint,
 )
+from ..internal_helpers.readers_helper_json import load_readers_json, save_readers_json, save_readers_jsonl
+from ..internal_helpers.readers_helper_text import process_readers_text_readahead, save_readers_text_parts
 from ..internal_helpers.readers_helper_logging import (
     record_readers_tool_event,
     record_readers_warning,
@@ -33,7 +41,14 @@ from ..core_functions.readers_core_native import (
     process_readers_pdf_document,
     process_readers_text_native,
 )
-from ..core_functions.readers_core_ocr import process_readers_ocr_result, run_pdf_ocr, process_readers_merge_text
+from ..core_functions.readers_core_pdf import open_readers_pdf_textpage
+from ..core_functions.readers_core_ocr import (
+    compute_readers_median_font_size_from_dict,
+    compute_readers_ocr_page_workers,
+    process_readers_merge_text,
+    process_readers_ocr_result,
+    run_pdf_ocr,
+)
 from ..core_functions.readers_core_tables import (
     process_readers_append_table_raw,
     compute_readers_cell_bbox_from_geometry,
@@ -49,6 +64,8 @@ OCR_LOW_CONF = float(SETTINGS.thresholds.get("ocr_low_conf", 75.0))
 OCR_LOW_TEXT_MIN_WORDS = int(SETTINGS.thresholds.get("ocr_low_text_min_words", 12))
 SUSPICIOUS_TEXT_CHARS_MIN = int(SETTINGS.thresholds.get("suspicious_text_chars_min", 40))
 TABLES_FEATURE_MODE = str(SETTINGS.features.get("tables_mode", "detect")).lower()
+OUTPUT_WRITER_WORKERS = 4
+PER_PAGE_CSV_FIELDS = ("page", "source", "conf", "ocr_words", "chars", "has_table", "tables_found", "table_cells", "flags", "decision", "lang", "locale", "time_ms")
 
 
 from ..core_functions.readers_core_tables_detector import LightTableDetector
@@ -56,21 +73,103 @@ from ..core_functions.readers_core_tables_detector import LightTableDetector
 DOCX_EXTS = {".docx"}
 IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".tiff", ".tif", ".bmp", ".gif", ".webp"}
 TEXT_EXTS = {".txt", ".log", ".md", ".csv", ".tsv", ".json", ".yaml", ".yml", ".ini", ".cfg", ".conf"}
+# Suffix -> orchestrator handler name; unknown suffixes are tried as images.
+READERS_EXT_HANDLERS: Dict[str, str] = {
+    ".pdf": "process_readers_pdf_document_page",
+    **{ext: "process_readers_docx_native_page" for ext in DOCX_EXTS},
+    **{ext: "process_readers_text_native_page" for ext in TEXT_EXTS},
+    **{ext: "process_readers_ocr_image_page" for ext in IMAGE_EXTS},
+}
 
 DOCX_PAGE_WIDTH_EMU = 8.27 * 914400
 DOCX_PAGE_HEIGHT_EMU = 11.69 * 914400
 
+LIST_ITEM_RE = re.compile(r"^(?:[0-9]+[).]|[A-Za-z][).])\s+")
+LIST_BULLET_PREFIXES = ("- ", "* ", "+ ", "\u2022", "\u2022 ")
+
+
+@lru_cache(maxsize=512)
+def check_readers_bold_font(font_name: str) -> bool:
+    """Return whether a font name marks a bold face; PDFs reuse a handful of names."""
+
+    return "bold" in font_name.lower()
+
+
+def compute_readers_letter_counts(text: str) -> Tuple[int, int]:
+    """Return ``(alpha_chars, uppercase_alpha_chars)`` for ``text`` in one pass."""
+
+    if text.isascii():
+        codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        upper = int(np.count_nonzero((codes >= 65) & (codes <= 90)))
+        return upper + int(np.count_nonzero((codes >= 97) & (codes <= 122))), upper
+    alpha = 0
+    upper = 0
+    for c in text:
+        if c.isalpha():
+            alpha += 1
+            if c.isupper():
+                upper += 1
+    return alpha, upper
+
+
+def compute_readers_record_payload(record: PageRecord) -> Dict[str, Any]:
+    """Return the unified_text.jsonl row for ``record``; ``ocr_conf_avg`` only when set."""
+
+    payload = {
+        "file": record.file,
+        "page": record.page,
+        "source": record.source,
+        "text": record.text,
+        "conf": record.conf,
+        "time_ms": record.time_ms,
+        "words": record.words,
+        "chars": record.chars,
+    }
+    if record.ocr_conf_avg is not None:
+        payload["ocr_conf_avg"] = record.ocr_conf_avg
+    return payload
+
+
+def compute_readers_record_totals(records: List[PageRecord]) -> Tuple[float, List[str]]:
+    """Return the average usable page confidence and the distinct files in one pass."""
+
+    conf_sum = 0.0
+    conf_count = 0
+    files: Set[str] = set()
+    add_file = files.add
+    for record in records:
+        add_file(record.file)
+        conf = record.conf
+        if 0.0 < conf < math.inf:
+            conf_sum += conf
+            conf_count += 1
+    return (conf_sum / conf_count if conf_count else 0.0), list(files)
+
+
+def compute_readers_stage_timings(timings: ReadersTimings) -> Dict[str, float]:
+    """Return only the stages that actually ran, keyed by stage name."""
+
+    return {key: value for key, value in asdict(timings).items() if value}
+
+
+def compute_readers_page_bbox_array(blocks: List[Dict[str, Any]]) -> np.ndarray:
+    """Stack the usable block bboxes of a page into an ``(N, 4)`` float array."""
+
+    boxes = [block["bbox"][:4] for block in blocks if isinstance(block.get("bbox"), list) and len(block["bbox"]) >= 4]
+    try:
+        return np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    except (TypeError, ValueError):
+        valid: List[List[float]] = []
+        for box in boxes:
+            try:
+                valid.append([float(value) for value in box])
+            except Exception:
+                continue
+        return np.asarray(valid, dtype=np.float64).reshape(-1, 4)
 
-def compute_readers_safe_avg_conf(conf_list) -> float:
-    values: List[float] = []
-    for value in conf_list or []:
-        try:
-            float_value = float(value)
-        except Exception:
-            continue
-        if float_value > 0:
-            values.append(float_value)
-    return sum(values) / len(values) if values else 0.0
+
+def compute_readers_merged_bbox(boxes: np.ndarray) -> List[float]:
+    return np.concatenate([boxes[:, :2].min(axis=0), boxes[:, 2:].max(axis=0)]).tolist()
 
 
 class ReadersOrchestrator:
@@ -83,9 +182,11 @@ class ReadersOrchestrator:
         self._warnings: List[str] = []
         self._page_decisions: List[str] = []
         self._tables: List[TableRecord] = []
+        self._tables_cells_total: int = 0
         self._tables_raw: List[Dict[str, Any]] = []
         self._blocks: List[Dict[str, Any]] = []
-        self._zones: List[Dict[str, Any]] = []
+        self._blocks_by_page: defaultdict[int, List[Dict[str, Any]]] = defaultdict(list)
+        self._zones_by_page: Dict[int, List[Dict[str, Any]]] = {}
         self._page_geometry: Dict[int, Dict[str, float]] = {}
         self._table_flags: Set[int] = set()
         self._table_candidates: Dict[int, Dict[str, float]] = {}
@@ -94,7 +195,7 @@ class ReadersOrchestrator:
         self._tool_events: List[Dict[str, Any]] = []
         self._visual_artifacts: List[Dict[str, Any]] = []
         self._block_counter: int = 0
-        self._timings: defaultdict[str, float] = defaultdict(float)
+        self._timings = ReadersTimings()
         self._structured_log_path = self.readers_dir / "structured_logs.jsonl"
         self._table_counts: defaultdict[int, int] = defaultdict(int)
         self._t0 = time.time()
@@ -117,9 +218,11 @@ class ReadersOrchestrator:
         self._warnings.clear()
         self._page_decisions.clear()
         self._tables.clear()
+        self._tables_cells_total = 0
         self._tables_raw.clear()
         self._blocks.clear()
-        self._zones.clear()
+        self._blocks_by_page.clear()
+        self._zones_by_page.clear()
         self._page_geometry.clear()
         self._table_flags.clear()
         self._table_candidates.clear()
@@ -127,16 +230,15 @@ class ReadersOrchestrator:
         self._page_locale_hints.clear()
         self._tool_events.clear()
         self._visual_artifacts.clear()
-        self._timings.clear()
+        self._timings = ReadersTimings()
         self._table_counts.clear()
         self._block_counter = 0
         self._t0 = time.time()
         self._light_tables.reset()
-        if self._structured_log_path.exists():
-            try:
-                self._structured_log_path.unlink()
-            except Exception:
-                pass
+        try:
+            self._structured_log_path.unlink(missing_ok=True)
+        except OSError:
+            pass
 
     def record_readers_warning_event(self, code: str) -> None:
         log_warning(self._structured_log_path, self._warnings, code)
@@ -174,15 +276,14 @@ class ReadersOrchestrator:
         return self.get_readers_blocks_for_page(page_no)
 
     def get_readers_blocks_for_page(self, page_no: int) -> List[Dict[str, Any]]:
-        results: List[Dict[str, Any]] = []
-        for block in self._blocks:
-            try:
-                page_value = int(block.get("page") or 0)
-            except Exception:
-                continue
-            if page_value == page_no:
-                results.append(block)
-        return results
+        return list(self._blocks_by_page.get(page_no, ()))
+
+    def record_readers_block_entry(self, entry: Dict[str, Any]) -> None:
+        # Every producer stores ``page`` as the int page number; keep it that way
+        # so the per-page index never has to re-parse it.
+        assert isinstance(entry["page"], int), entry.get("page")
+        self._blocks.append(entry)
+        self._blocks_by_page[entry["page"]].append(entry)
 
     def process_readers_zones(self, page, page_no: int) -> None:
         try:
@@ -198,39 +299,24 @@ class ReadersOrchestrator:
             return
         header_band = y0 + page_height * 0.12
         footer_band = y1 - page_height * 0.12
-        header_boxes: List[Tuple[float, float, float, float]] = []
-        footer_boxes: List[Tuple[float, float, float, float]] = []
-        for block in self.get_readers_blocks_for_page(page_no):
-            bbox = block.get("bbox")
-            if not isinstance(bbox, list) or len(bbox) < 4:
-                continue
-            try:
-                bx0, by0, bx1, by1 = (float(bbox[0]), float(bbox[1]), float(bbox[2]), float(bbox[3]))
-            except Exception:
-                continue
-            if by1 <= header_band:
-                header_boxes.append((bx0, by0, bx1, by1))
-            if by0 >= footer_band:
-                footer_boxes.append((bx0, by0, bx1, by1))
-        self._zones = [zone for zone in self._zones if int(zone.get("page", 0)) != page_no]
-        def _merge(boxes: List[Tuple[float, float, float, float]]) -> List[float]:
-            return [
-                min(b[0] for b in boxes),
-                min(b[1] for b in boxes),
-                max(b[2] for b in boxes),
-                max(b[3] for b in boxes),
-            ]
-        if header_boxes:
-            self._zones.append({"page": page_no, "bbox": _merge(header_boxes), "type": "header"})
-        if footer_boxes:
-            self._zones.append({"page": page_no, "bbox": _merge(footer_boxes), "type": "footer"})
-        header_bottom = max((box[3] for box in header_boxes), default=y0)
-        footer_top = min((box[1] for box in footer_boxes), default=y1)
-        body_top = header_bottom if header_boxes else y0
-        body_bottom = footer_top if footer_boxes else y1
+        bboxes = compute_readers_page_bbox_array(self.get_readers_blocks_for_page(page_no))
+        header_boxes = bboxes[bboxes[:, 3] <= header_band]
+        footer_boxes = bboxes[bboxes[:, 1] >= footer_band]
+        # Re-zoning a page replaces its zones and moves them to the end.
+        self._zones_by_page.pop(page_no, None)
+        zones = self._zones_by_page[page_no] = []
+        if len(header_boxes):
+            zones.append({"page": page_no, "bbox": compute_readers_merged_bbox(header_boxes), "type": "header"})
+        if len(footer_boxes):
+            zones.append({"page": page_no, "bbox": compute_readers_merged_bbox(footer_boxes), "type": "footer"})
+        body_top = float(header_boxes[:, 3].max()) if len(header_boxes) else y0
+        body_bottom = float(footer_boxes[:, 1].min()) if len(footer_boxes) else y1
         if body_bottom <= body_top:
             body_top, body_bottom = y0, y1
-        self._zones.append({"page": page_no, "bbox": [x0, body_top, x1, body_bottom], "type": "body"})
+        zones.append({"page": page_no, "bbox": [x0, body_top, x1, body_bottom], "type": "body"})
+
+    def get_readers_zones(self) -> List[Dict[str, Any]]:
+        return [zone for zones in self._zones_by_page.values() for zone in zones]
 
     def _native_page_data(self, page, page_no: int) -> Dict[str, Any]:
         return self.get_readers_native_page_data(page, page_no)
@@ -271,21 +357,32 @@ class ReadersOrchestrator:
         record_readers_table_candidate_entry(self, page, page_no, decision, status, extraction_tool, bbox, metrics, geometry)
 
 
-    def compute_readers_style_features(self, text: str, font_sizes: List[float], spans_meta: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def compute_readers_style_features(
+        self,
+        text: str,
+        font_sizes: List[float],
+        spans_meta: List[Dict[str, Any]],
+        *,
+        font_stats: Optional[Tuple[float, float]] = None,
+        is_bold: Optional[bool] = None,
+        letter_counts: Optional[Tuple[int, int]] = None,
+    ) -> Dict[str, Any]:
         text = text or ""
         char_count = len(text)
-        alpha_chars = sum(1 for c in text if c.isalpha())
-        uppercase_chars = sum(1 for c in text if c.isalpha() and c.isupper())
+        alpha_chars, uppercase_chars = letter_counts or compute_readers_letter_counts(text)
         is_upper = bool(alpha_chars) and (uppercase_chars / alpha_chars) >= 0.75
         font_avg: Optional[float] = None
-        if font_sizes:
+        if font_stats is not None:
+            font_avg = round(font_stats[0], 2)
+        elif font_sizes:
             try:
                 font_avg = round(sum(font_sizes) / max(len(font_sizes), 1), 2)
             except Exception:
                 font_avg = None
-        fonts = [str(meta.get("font") or "") for meta in spans_meta]
-        flags = [int(meta.get("flags") or 0) for meta in spans_meta]
-        is_bold = any("bold" in font.lower() for font in fonts if font) or any(flag & 2 for flag in flags)
+        if is_bold is None:
+            fonts = [str(meta.get("font") or "") for meta in spans_meta]
+            flags = [int(meta.get("flags") or 0) for meta in spans_meta]
+            is_bold = any(check_readers_bold_font(font) for font in fonts if font) or any(flag & 2 for flag in flags)
         return {
             "font_size_avg": font_avg,
             "is_bold": is_bold,
@@ -310,39 +407,89 @@ class ReadersOrchestrator:
     def _merge_hint(self, current: Optional[str], new: Optional[str]) -> str:
         return compute_merged_language_hint(current, new)
 
+    def compute_readers_tables_cells_by_page(self) -> Dict[int, int]:
+        """Return the number of extracted table cells per page."""
+
+        cells: Dict[int, int] = {}
+        cells_get = cells.get
+        for table in self._tables:
+            page = int(table.page)
+            cells[page] = cells_get(page, 0) + sum(map(len, table.rows or []))
+        return cells
+
+    def compute_readers_page_listings(self) -> Dict[str, Any]:
+        """Return the page-ordered summary listings built from one sorted page list."""
+
+        lang_hints = self._page_language_hints
+        locale_hints = self._page_locale_hints
+        candidates = self._table_candidates
+        counts = self._table_counts
+        geometry = self._page_geometry
+        pages = sorted(lang_hints.keys() | locale_hints.keys() | candidates.keys() | counts.keys() | geometry.keys())
+        lang_per_page: List[Dict[str, Any]] = []
+        locale_per_page: List[Dict[str, Any]] = []
+        table_stats: List[Dict[str, Any]] = []
+        table_counts: Dict[int, int] = {}
+        page_geometry: Dict[int, Dict[str, Any]] = {}
+        for page in pages:
+            # Language and locale hints are always recorded together.
+            if page in lang_hints or page in locale_hints:
+                lang_per_page.append({"page": page, "lang": lang_hints.get(page, "unknown")})
+                locale_per_page.append({"page": page, "locale": locale_hints.get(page, "unknown")})
+            if page in candidates:
+                table_stats.append({"page": page, **candidates[page]})
+            if page in counts:
+                table_counts[page] = counts[page]
+            if page in geometry:
+                page_geometry[page] = {
+                    key: (float(value) if isinstance(value, (int, float)) else value)
+                    for key, value in geometry[page].items()
+                }
+        return {
+            "lang_per_page": lang_per_page,
+            "locale_per_page": locale_per_page,
+            "table_stats": table_stats,
+            "table_counts": table_counts,
+            "page_geometry": page_geometry,
+        }
+
     def process_readers_page_hints(self, page_no: int, text: str) -> None:
         start = time.perf_counter()
-        lang_hint = compute_language_hint(text)
-        locale_hint = compute_locale_hint(text)
+        lang_hint, locale_hint = compute_language_and_locale_hint(text)
         self._page_language_hints[page_no] = compute_merged_language_hint(self._page_language_hints.get(page_no), lang_hint)
         self._page_locale_hints[page_no] = compute_merged_language_hint(self._page_locale_hints.get(page_no), locale_hint)
-        self._timings["lang_detect"] += (time.perf_counter() - start) * 1000.0
+        self._timings.lang_detect += (time.perf_counter() - start) * 1000.0
 
 
     def get_readers_native_page_data(self, page, page_no: int) -> Dict[str, Any]:
         start = time.perf_counter()
         text = ""
         blocks: List[Dict[str, Any]] = []
+        # Both extractions read the same parsed TextPage instead of each
+        # re-interpreting the page content stream.
+        textpage = open_readers_pdf_textpage(page)
         try:
-            text = page.get_text("text") or ""
+            text = page.get_text("text", textpage=textpage) or ""
         except Exception:
             text = ""
         try:
-            blocks_dict = page.get_text("dict") or {}
+            blocks_dict = page.get_text("dict", textpage=textpage) or {}
         except Exception:
             blocks_dict = {}
+        font_median = None
         if isinstance(blocks_dict, dict):
             try:
                 blocks = self.compute_readers_block_entries(blocks_dict, page_no)
             except Exception:
                 blocks = []
+            font_median = compute_readers_median_font_size_from_dict(blocks_dict)
         block_count = len(blocks)
         if not text and blocks:
             text = "\n".join(entry.get("text_raw", "") for entry in blocks).strip()
         words = len(text.split()) if text else 0
         conf = self.compute_readers_native_confidence(text, block_count, words)
         elapsed = (time.perf_counter() - start) * 1000.0
-        self._timings["text_extract"] += elapsed
+        self._timings.text_extract += elapsed
         return {
             "text": text,
             "conf": conf,
@@ -350,18 +497,22 @@ class ReadersOrchestrator:
             "block_count": block_count,
             "time_ms": elapsed,
             "blocks": blocks,
+            "font_median": font_median,
         }
 
     def compute_readers_block_entries(self, blocks_dict: Dict[str, Any], page_no: int) -> List[Dict[str, Any]]:
         entries: List[Dict[str, Any]] = []
         blocks = blocks_dict.get("blocks") or []
+        pending: List[Tuple[int, Any, str, List[str], bool]] = []
+        page_sizes: List[float] = []
+        size_counts: List[int] = []
         for idx, block in enumerate(blocks):
             if block.get("type") not in (None, 0):
                 continue
             lines = block.get("lines") or []
             text_lines: List[str] = []
-            font_sizes: List[float] = []
-            spans_meta: List[Dict[str, Any]] = []
+            sizes_start = len(page_sizes)
+            is_bold = False
             for line in lines:
                 spans = line.get("spans") or []
                 parts: List[str] = []
@@ -369,17 +520,13 @@ class ReadersOrchestrator:
                     piece = span.get("text") or ""
                     if piece:
                         parts.append(piece)
-                    spans_meta.append(
-                        {
-                            "font": span.get("font"),
-                            "flags": span.get("flags"),
-                            "size": span.get("size"),
-                        }
-                    )
+                    if not is_bold:
+                        font = span.get("font")
+                        is_bold = bool(font and check_readers_bold_font(font)) or bool(int(span.get("flags") or 0) & 2)
                     size = span.get("size")
                     if size is not None:
                         try:
-                            font_sizes.append(float(size))
+                            page_sizes.append(float(size))
                         except Exception:
                             continue
                 line_text = "".join(parts).strip("\n")
@@ -387,7 +534,27 @@ class ReadersOrchestrator:
                     text_lines.append(line_text)
             text_raw = "\n".join(text_lines).strip()
             if not text_raw:
+                del page_sizes[sizes_start:]
                 continue
+            pending.append((idx, block, text_raw, text_lines, is_bold))
+            size_counts.append(len(page_sizes) - sizes_start)
+        if not pending:
+            return entries
+
+        # Font statistics for every block on the page in one pair of reductions.
+        counts = np.asarray(size_counts, dtype=np.int64)
+        has_sizes = counts > 0
+        means = np.zeros(len(pending), dtype=np.float64)
+        maxima = np.zeros(len(pending), dtype=np.float64)
+        if page_sizes:
+            sizes = np.asarray(page_sizes, dtype=np.float64)
+            starts = (np.cumsum(counts) - counts)[has_sizes]
+            means[has_sizes] = np.add.reduceat(sizes, starts) / counts[has_sizes]
+            maxima[has_sizes] = np.maximum.reduceat(sizes, starts)
+
+        for position, (idx, block, text_raw, text_lines, is_bold) in enumerate(pending):
+            font_stats = (float(means[position]), float(maxima[position])) if has_sizes[position] else None
+            letter_counts = compute_readers_letter_counts(text_raw)
             entry = {
                 "id": f"{page_no}-{idx}",
                 "page": page_no,
@@ -395,26 +562,42 @@ class ReadersOrchestrator:
                 "text_lines": text_lines,
                 "bbox": list(block.get("bbox") or []),
                 "reading_order_index": None,
-                "is_heading_like": self.check_readers_heading_like(text_raw, font_sizes, text_lines),
+                "is_heading_like": self.check_readers_heading_like(
+                    text_raw, [], text_lines, font_stats=font_stats, letter_counts=letter_counts
+                ),
                 "is_list_like": self.check_readers_list_like(text_raw),
                 "ocr_conf_avg": None,
             }
-            entry.update(self.compute_readers_style_features(text_raw, font_sizes, spans_meta))
+            entry.update(
+                self.compute_readers_style_features(
+                    text_raw, [], [], font_stats=font_stats, is_bold=is_bold, letter_counts=letter_counts
+                )
+            )
             entries.append(entry)
         return entries
 
-    def check_readers_heading_like(self, text_raw: str, font_sizes: List[float], text_lines: List[str]) -> bool:
+    def check_readers_heading_like(
+        self,
+        text_raw: str,
+        font_sizes: List[float],
+        text_lines: List[str],
+        *,
+        font_stats: Optional[Tuple[float, float]] = None,
+        letter_counts: Optional[Tuple[int, int]] = None,
+    ) -> bool:
         trimmed = text_raw.strip()
         if not trimmed:
             return False
         words = trimmed.split()
         if len(words) > 12:
             return False
-        alpha_count = sum(1 for c in trimmed if c.isalpha())
-        upper_count = sum(1 for c in trimmed if c.isupper())
+        alpha_count, upper_count = letter_counts or compute_readers_letter_counts(trimmed)
         uppercase_ratio = (upper_count / alpha_count) if alpha_count else 0.0
-        max_size = max(font_sizes) if font_sizes else 0.0
-        mean_size = (sum(font_sizes) / len(font_sizes)) if font_sizes else 0.0
+        if font_stats is not None:
+            mean_size, max_size = font_stats
+        else:
+            max_size = max(font_sizes) if font_sizes else 0.0
+            mean_size = (sum(font_sizes) / len(font_sizes)) if font_sizes else 0.0
         if uppercase_ratio >= 0.6 and len(words) <= 8:
             return True
         if max_size and max_size >= max(14.0, mean_size * 1.2):
@@ -427,12 +610,7 @@ class ReadersOrchestrator:
         stripped = (text_raw or "").lstrip()
         if not stripped:
             return False
-        bullet_prefixes = ("- ", "* ", "+ ", "\u2022", "\u2022 ")
-        if stripped.startswith(bullet_prefixes):
-            return True
-        if re.match(r"^([0-9]+[\\).]|[a-zA-Z][\\).])\\s+", stripped):
-            return True
-        return False
+        return stripped.startswith(LIST_BULLET_PREFIXES) or LIST_ITEM_RE.match(stripped) is not None
 
     def record_readers_page_blocks(
         self,
@@ -446,8 +624,13 @@ class ReadersOrchestrator:
         blocks_to_use = native_blocks or []
         if blocks_to_use:
             for block in blocks_to_use:
-                lang_hint = block.get("lang_hint") or self._infer_language_hint(block.get("text_raw", ""))
-                locale_hint = block.get("locale_hint") or self._infer_locale_hint(block.get("text_raw", ""))
+                lang_hint = block.get("lang_hint")
+                locale_hint = block.get("locale_hint")
+                if not lang_hint and not locale_hint:
+                    lang_hint, locale_hint = compute_language_and_locale_hint(block.get("text_raw") or "")
+                else:
+                    lang_hint = lang_hint or self._infer_language_hint(block.get("text_raw", ""))
+                    locale_hint = locale_hint or self._infer_locale_hint(block.get("text_raw", ""))
                 entry = {
                     "id": block.get("id") or f"{page_no}-{self._block_counter}",
                     "page": page_no,
@@ -467,7 +650,7 @@ class ReadersOrchestrator:
                 }
                 if "ocr" in decision_lower and ocr_avg_conf is not None:
                     entry["ocr_conf_avg"] = ocr_avg_conf
-                self._blocks.append(entry)
+                self.record_readers_block_entry(entry)
                 self._block_counter += 1
                 self._page_language_hints[page_no] = self._merge_hint(self._page_language_hints.get(page_no), lang_hint)
                 self._page_locale_hints[page_no] = self._merge_hint(self._page_locale_hints.get(page_no), locale_hint)
@@ -490,8 +673,7 @@ class ReadersOrchestrator:
         lines = [line.strip() for line in stripped.splitlines() if line.strip()] or [stripped]
         normalized_text = "\n".join(lines)
         decision_lower = (decision or "").lower()
-        lang_hint = compute_language_hint(normalized_text)
-        locale_hint = compute_locale_hint(normalized_text)
+        lang_hint, locale_hint = compute_language_and_locale_hint(normalized_text)
         entry = {
             "id": f"{page_no}-block-{self._block_counter}",
             "page": page_no,
@@ -506,7 +688,7 @@ class ReadersOrchestrator:
             "locale_hint": locale_hint,
         }
         entry.update(self.compute_readers_style_features(normalized_text, [], []))
-        self._blocks.append(entry)
+        self.record_readers_block_entry(entry)
         self._block_counter += 1
         self._page_language_hints[page_no] = compute_merged_language_hint(self._page_language_hints.get(page_no), lang_hint)
         self._page_locale_hints[page_no] = compute_merged_language_hint(self._page_locale_hints.get(page_no), locale_hint)
@@ -550,7 +732,8 @@ class ReadersOrchestrator:
 
     @staticmethod
     def compute_readers_native_confidence(text: str, block_count: int, words: int) -> float:
-        if not text.strip():
+        # isspace() answers the blank-page question without copying the page text.
+        if not text or text.isspace():
             return 0.0
         block_factor = min(block_count, 8) / 8.0
         word_factor = min(words / 120.0, 1.0)
@@ -571,7 +754,7 @@ class ReadersOrchestrator:
             return False
         if coverage < self.opts.overlay_area_thr and not self.opts.overlay_if_any_image:
             return False
-        if not text.strip():
+        if not text or text.isspace():
             return True
         return conf < 85.0
 
@@ -628,27 +811,123 @@ class ReadersOrchestrator:
         process_readers_pdf_document(self, path)
 
 
+    def process_readers_input_file(self, path: Path) -> None:
+        ext = path.suffix.lower()
+        handler = READERS_EXT_HANDLERS.get(ext)
+        if handler is None:
+            self.record_readers_warning_event(f"unknown_ext:{ext or 'none'}")
+            handler = "process_readers_ocr_image_page"
+        getattr(self, handler)(path)
+
+    def get_readers_partial_state(self) -> Dict[str, Any]:
+        """Snapshot the per-file state so it can be shipped back from a worker."""
+
+        return {
+            "records": list(self._records),
+            "warnings": list(self._warnings),
+            "page_decisions": list(self._page_decisions),
+            "tables": list(self._tables),
+            "tables_cells": self._tables_cells_total,
+            "tables_raw": list(self._tables_raw),
+            "blocks": list(self._blocks),
+            "zones": dict(self._zones_by_page),
+            "page_geometry": dict(self._page_geometry),
+            "table_flags": set(self._table_flags),
+            "table_candidates": dict(self._table_candidates),
+            "page_language_hints": dict(self._page_language_hints),
+            "page_locale_hints": dict(self._page_locale_hints),
+            "tool_events": list(self._tool_events),
+            "visual_artifacts": list(self._visual_artifacts),
+            "block_count": self._block_counter,
+            "timings": asdict(self._timings),
+            "table_counts": dict(self._table_counts),
+            "light_candidates": list(self._light_tables._candidates),
+        }
+
+    def record_readers_partial_state(self, partial: Dict[str, Any]) -> None:
+        """Merge a worker snapshot as if the file had been processed in-line."""
+
+        offset = self._block_counter
+        for block in partial["blocks"]:
+            index = block.get("reading_order_index")
+            if isinstance(index, int):
+                if block.get("id") == f"{block.get('page')}-block-{index}":
+                    block["id"] = f"{block.get('page')}-block-{index + offset}"
+                block["reading_order_index"] = index + offset
+            self.record_readers_block_entry(block)
+        self._block_counter = offset + int(partial["block_count"])
+
+        self._records.extend(partial["records"])
+        for code in partial["warnings"]:
+            if code not in self._warnings:
+                self._warnings.append(code)
+        self._page_decisions.extend(partial["page_decisions"])
+        self._tables.extend(partial["tables"])
+        self._tables_cells_total += int(partial["tables_cells"])
+        self._tables_raw.extend(partial["tables_raw"])
+        for page_no, zones in partial["zones"].items():
+            self._zones_by_page.pop(page_no, None)
+            self._zones_by_page[page_no] = zones
+        self._page_geometry.update(partial["page_geometry"])
+        self._table_flags.update(partial["table_flags"])
+        self._table_candidates.update(partial["table_candidates"])
+        for page_no, hint in partial["page_language_hints"].items():
+            self._page_language_hints[page_no] = compute_merged_language_hint(self._page_language_hints.get(page_no), hint)
+        for page_no, hint in partial["page_locale_hints"].items():
+            self._page_locale_hints[page_no] = compute_merged_language_hint(self._page_locale_hints.get(page_no), hint)
+        self._tool_events.extend(partial["tool_events"])
+        self._visual_artifacts.extend(partial["visual_artifacts"])
+        for key, value in partial["timings"].items():
+            setattr(self._timings, key, getattr(self._timings, key) + value)
+        for page_no, count in partial["table_counts"].items():
+            self._table_counts[page_no] += count
+        self._light_tables._candidates.extend(partial["light_candidates"])
+
+    def compute_readers_worker_count(self, file_count: int) -> int:
+        """Number of worker processes for ``process``; 1 (in-line) unless ``file_workers`` opts in."""
+
+        try:
+            requested = int(self.opts.file_workers or 1)
+        except Exception:
+            requested = 1
+        return max(1, min(requested, file_count, os.cpu_count() or 1))
+
+    def get_readers_worker_options(self, workers: int) -> ReaderOptions:
+        """Options for worker processes, splitting the OCR thread budget between them."""
+
+        ocr_threads = compute_readers_ocr_page_workers(getattr(self.opts, "workers", None))
+        return replace(self.opts, workers=max(1, ocr_threads // workers), file_workers=1)
+
     def process(self, inputs) -> Dict[str, object]:
         self.reset_readers_state()
-        files: List[str] = []
-        mode = (self.opts.mode or "mixed").lower()
-        for item in inputs:
-            path = Path(item)
-            files.append(str(path))
-            ext = path.suffix.lower()
-            if ext == ".pdf":
-                self.process_readers_pdf_document_page(path)
-            elif ext in DOCX_EXTS:
-                self.process_readers_docx_native_page(path)
-            elif ext in TEXT_EXTS:
-                self.process_readers_text_native_page(path)
-            elif ext in IMAGE_EXTS:
-                self.process_readers_ocr_image_page(path)
-            else:
-                self.record_readers_warning_event(f"unknown_ext:{ext or 'none'}")
-                self.process_readers_ocr_image_page(path)
+        paths = [Path(item) for item in inputs]
+        files: List[str] = [str(path) for path in paths]
+        # Plain-text inputs are small and read back to back; queue their reads now.
+        process_readers_text_readahead(path for path in paths if path.suffix.lower() in TEXT_EXTS)
+        workers = self.compute_readers_worker_count(len(paths))
+        if workers > 1:
+            # Files are independent: parse them in worker processes and merge
+            # the snapshots back in input order so block ordering is stable.
+            # A file whose worker failed is re-run in-line at its position.
+            worker_opts = self.get_readers_worker_options(workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(process_readers_single_input, type(self), self.base_outdir, worker_opts, path)
+                    for path in paths
+                ]
+                for path, future in zip(paths, futures):
+                    try:
+                        partial = future.result()
+                    except Exception as exc:
+                        self.record_readers_warning_event(f"parallel_readers_fallback:{type(exc).__name__}")
+                        self.process_readers_input_file(path)
+                    else:
+                        self.record_readers_partial_state(partial)
+        else:
+            for path in paths:
+                self.process_readers_input_file(path)
         self.save_readers_outputs(files)
-        avg_conf = compute_readers_safe_avg_conf([record.conf for record in self._records])
+        avg_conf, _ = compute_readers_record_totals(self._records)
         total_ms = (time.time() - self._t0) * 1000.0
         summary = Summary(
             files=files,
@@ -661,26 +940,19 @@ class ReadersOrchestrator:
         summary_dict = asdict(summary)
         summary_dict["text_blocks_count"] = len(self._blocks)
         summary_dict["table_pages"] = sorted(self._table_flags)
-        summary_dict["table_stats"] = [
-            {"page": int(page), **metrics}
-            for page, metrics in sorted(self._table_candidates.items())
-        ]
+        listings = self.compute_readers_page_listings()
+        summary_dict["table_stats"] = listings["table_stats"]
         summary_dict["visual_artifacts_count"] = len(self._visual_artifacts)
-        summary_dict["lang_per_page"] = [
-            {"page": page, "lang": self._page_language_hints.get(page, "unknown")}
-            for page in sorted(self._page_language_hints)
-        ]
-        summary_dict["locale_per_page"] = [
-            {"page": page, "locale": self._page_locale_hints.get(page, "unknown")}
-            for page in sorted(self._page_locale_hints)
-        ]
-        if self._timings:
+        summary_dict["lang_per_page"] = listings["lang_per_page"]
+        summary_dict["locale_per_page"] = listings["locale_per_page"]
+        stage_timings = compute_readers_stage_timings(self._timings)
+        if stage_timings:
             timings_payload = dict(summary_dict.get("timings_ms") or {})
-            for key, value in self._timings.items():
+            for key, value in stage_timings.items():
                 timings_payload[key] = round(float(value), 2)
             summary_dict["timings_ms"] = timings_payload
-        if self._table_counts:
-            summary_dict["table_counts"] = {int(page): count for page, count in sorted(self._table_counts.items())}
+        if listings["table_counts"]:
+            summary_dict["table_counts"] = listings["table_counts"]
         tool_log = [dict(event) for event in self._tool_events]
         summary_dict["tool_log"] = tool_log
         return {
@@ -689,7 +961,7 @@ class ReadersOrchestrator:
             "tool_log": tool_log,
             "visual_artifacts_count": len(self._visual_artifacts),
             "tables_count": len(self._tables),
-            "tables_cells": sum(sum(len(row) for row in tbl.rows) for tbl in self._tables),
+            "tables_cells": self._tables_cells_total,
             "outdir": str(self.readers_dir),
         }
 
@@ -698,83 +970,96 @@ class ReadersOrchestrator:
     # ------------------------------------------------------------------
     def save_readers_outputs(self, inputs) -> None:
         self.readers_dir.mkdir(parents=True, exist_ok=True)
-        jsonl_path = self.readers_dir / "unified_text.jsonl"
-        with open(jsonl_path, "w", encoding="utf-8") as handle:
-            for record in self._records:
-                handle.write(
-                    json.dumps(
-                        {
-                            "file": record.file,
-                            "page": record.page,
-                            "source": record.source,
-                            "text": record.text,
-                            "conf": record.conf,
-                            "time_ms": record.time_ms,
-                            "words": record.words,
-                            "chars": record.chars,
-                            **({"ocr_conf_avg": record.ocr_conf_avg} if record.ocr_conf_avg is not None else {}),
-                        },
-                        ensure_ascii=False,
-                    )
-                    + "\n"
-                )
-        txt_path = self.readers_dir / "unified_text.txt"
-        with open(txt_path, "w", encoding="utf-8") as handle:
-            for record in self._records:
-                header = (
-                    f"# file={record.file} page={record.page} source={record.source} "
-                    f"conf={record.conf:.2f} time_ms={record.time_ms:.2f} words={record.words} chars={record.chars}"
-                )
-                if record.ocr_conf_avg is not None:
-                    header += f" ocr_conf_avg={record.ocr_conf_avg:.2f}"
-                handle.write(header + "\n")
-                handle.write((record.text or "").strip() + "\n\n")
+        # The artifact files are independent of each other, so they are written
+        # concurrently; each job is (writer, rows, destination).
+        writes: List[Tuple[Any, Any, Path]] = []
+        # One pass over the records feeds the JSONL rows, the TXT parts and the
+        # per-page lookup the summary enrichment would otherwise re-read from disk.
+        rows: List[Dict[str, Any]] = []
+        page_records: Dict[int, Dict[str, Any]] = {}
+        parts: List[str] = []
+        append = parts.append
+        for record in self._records:
+            row = compute_readers_record_payload(record)
+            rows.append(row)
+            page_records[int(record.page or 0)] = row
+            ocr_suffix = f" ocr_conf_avg={record.ocr_conf_avg:.2f}" if record.ocr_conf_avg is not None else ""
+            append(
+                f"# file={record.file} page={record.page} source={record.source} "
+                f"conf={record.conf:.2f} time_ms={record.time_ms:.2f} words={record.words} chars={record.chars}{ocr_suffix}\n"
+            )
+            append((record.text or "").strip())
+            append("\n\n")
+        writes.append((save_readers_jsonl, rows, self.readers_dir / "unified_text.jsonl"))
+        writes.append((save_readers_text_parts, parts, self.readers_dir / "unified_text.txt"))
         blocks_path = self.readers_dir / "text_blocks.jsonl"
         if self._blocks:
-            with open(blocks_path, "w", encoding="utf-8") as handle:
-                for block in self._blocks:
-                    handle.write(json.dumps(block, ensure_ascii=False) + "\n")
+            writes.append((save_readers_jsonl, self._blocks, blocks_path))
         zones_path = self.readers_dir / "zones.jsonl"
-        if self._zones:
-            with open(zones_path, "w", encoding="utf-8") as handle:
-                for zone in self._zones:
-                    handle.write(json.dumps(zone, ensure_ascii=False) + "\n")
-        elif zones_path.exists():
-            try:
-                zones_path.unlink()
-            except Exception:
-                pass
-        tables_raw_path = self.readers_dir / "tables_raw.jsonl"
-        if tables_raw_path.exists():
+        zones = self.get_readers_zones()
+        if zones:
+            writes.append((save_readers_jsonl, zones, zones_path))
+        else:
             try:
-                tables_raw_path.unlink()
-            except Exception:
+                zones_path.unlink(missing_ok=True)
+            except OSError:
                 pass
+        try:
+            (self.readers_dir / "tables_raw.jsonl").unlink(missing_ok=True)
+        except OSError:
+            pass
         self._light_tables.flush()
         tables_path = self.readers_dir / "tables.jsonl"
         if self._tables:
-            with open(tables_path, "w", encoding="utf-8") as handle:
-                for table in self._tables:
-                    payload = {"file": table.file, "page": table.page, "decision": table.decision, "rows": table.rows}
-                    if table.metrics:
-                        payload["metrics"] = table.metrics
-                    handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
-            (self.readers_dir / "tables.json").write_text(
-                json.dumps({"tables": [asdict(table) for table in self._tables]}, ensure_ascii=False, indent=2),
-                encoding="utf-8",
+            writes.append(
+                (
+                    save_readers_jsonl,
+                    (
+                        {
+                            "file": table.file,
+                            "page": table.page,
+                            "decision": table.decision,
+                            "rows": table.rows,
+                            **({"metrics": table.metrics} if table.metrics else {}),
+                        }
+                        for table in self._tables
+                    ),
+                    tables_path,
+                )
+            )
+            # Shallow projections: asdict would deep-copy every rows matrix only to serialize it.
+            writes.append(
+                (
+                    save_readers_json,
+                    {
+                        "tables": [
+                            {
+                                "file": table.file,
+                                "page": table.page,
+                                "rows": table.rows,
+                                "decision": table.decision,
+                                "metrics": table.metrics,
+                            }
+                            for table in self._tables
+                        ]
+                    },
+                    self.readers_dir / "tables.json",
+                )
             )
         artifacts_path = self.readers_dir / "visual_artifacts.jsonl"
-        with open(artifacts_path, "w", encoding="utf-8") as handle:
-            for artifact in self._visual_artifacts:
-                handle.write(json.dumps(artifact, ensure_ascii=False) + "\n")
-        avg_conf = compute_readers_safe_avg_conf([record.conf for record in self._records])
+        writes.append((save_readers_jsonl, self._visual_artifacts, artifacts_path))
+        log_path = self.readers_dir / "tool_log.jsonl"
+        if self._tool_events:
+            writes.append((save_readers_jsonl, self._tool_events, log_path))
+        with ThreadPoolExecutor(max_workers=OUTPUT_WRITER_WORKERS) as pool:
+            futures = [pool.submit(writer, rows, destination) for writer, rows, destination in writes]
+        for future in futures:
+            future.result()
+        avg_conf, record_files = compute_readers_record_totals(self._records)
         total_ms = (time.time() - self._t0) * 1000.0
-        table_stats = [
-            {"page": int(page), **metrics}
-            for page, metrics in sorted(self._table_candidates.items())
-        ]
+        listings = self.compute_readers_page_listings()
         summary = {
-            "files": list({record.file for record in self._records}) or [str(p) for p in inputs],
+            "files": record_files or [str(p) for p in inputs],
             "page_count": len(self._page_decisions),
             "avg_conf": avg_conf,
             "warnings": self._warnings,
@@ -782,56 +1067,81 @@ class ReadersOrchestrator:
             "page_decisions": self._page_decisions,
             "tables_count": len(self._tables),
             "table_pages": sorted(self._table_flags),
-            "table_stats": table_stats,
+            "table_stats": listings["table_stats"],
             "text_blocks_count": len(self._blocks),
             "visual_artifacts_count": len(self._visual_artifacts),
-            "lang_per_page": [
-                {"page": page, "lang": self._page_language_hints.get(page, "unknown")}
-                for page in sorted(self._page_language_hints)
-            ],
-            "locale_per_page": [
-                {"page": page, "locale": self._page_locale_hints.get(page, "unknown")}
-                for page in sorted(self._page_locale_hints)
-            ],
-            "tool_log": [dict(event) for event in self._tool_events],
+            "lang_per_page": listings["lang_per_page"],
+            "locale_per_page": listings["locale_per_page"],
+            "tool_log": self._tool_events,
         }
-        if self._timings:
+        stage_timings = compute_readers_stage_timings(self._timings)
+        if stage_timings:
             timings_payload = dict(summary.get("timings_ms") or {})
-            for key, value in self._timings.items():
+            for key, value in stage_timings.items():
                 timings_payload[key] = round(float(value), 2)
             summary["timings_ms"] = timings_payload
-        if self._table_counts:
-            summary["table_counts"] = {int(page): count for page, count in sorted(self._table_counts.items())}
-        if self._page_geometry:
-            summary["page_geometry"] = {int(page): {key: (float(value) if isinstance(value, (int, float)) else value) for key, value in data.items()} for page, data in sorted(self._page_geometry.items())}
+        if listings["table_counts"]:
+            summary["table_counts"] = listings["table_counts"]
+        if listings["page_geometry"]:
+            summary["page_geometry"] = listings["page_geometry"]
         summary_path = self.readers_dir / "readers_summary.json"
-        payload = {"summary": summary, "tool_log": summary["tool_log"]}
-        summary_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        payload: Dict[str, Any] = {"summary": summary}
         if self._tool_events:
-            log_path = self.readers_dir / "tool_log.jsonl"
-            with open(log_path, "w", encoding="utf-8") as handle:
-                for event in self._tool_events:
-                    handle.write(json.dumps(event, ensure_ascii=False) + "\n")
+            payload["tool_log_ref"] = log_path.name
         try:
-            process_readers_enrich_summary_on_disk(self.readers_dir, self.opts)
+            process_readers_enrich_summary_on_disk(
+                self.readers_dir,
+                self.opts,
+                payload=payload,
+                tables_cells=self.compute_readers_tables_cells_by_page(),
+                page_records=page_records,
+            )
         except Exception as exc:
+            save_readers_json(payload, summary_path)
             self.record_readers_warning_event(f"enrich_error:{exc}")
 
 
-def process_readers_enrich_summary_on_disk(outdir: Path, opts: ReaderOptions):
-    """Enrich readers_summary.json with per-page statistics and review flags."""
+def process_readers_single_input(
+    factory: Callable[[Path, ReaderOptions], "ReadersOrchestrator"],
+    outdir: Path,
+    opts: ReaderOptions,
+    path: Path,
+) -> Dict[str, Any]:
+    """Process one input in isolation and return its mergeable state.
+
+    ``factory`` is the orchestrator class (picklable), so subclasses keep their
+    handlers. The fresh orchestrator is not reset: resetting would unlink the
+    shared ``readers/`` logs the parent and other workers are using.
+    """
+
+    orchestrator = factory(outdir, opts)
+    orchestrator.process_readers_input_file(Path(path))
+    return orchestrator.get_readers_partial_state()
+
+
+def process_readers_enrich_summary_on_disk(
+    outdir: Path,
+    opts: ReaderOptions,
+    payload: Optional[Dict[str, Any]] = None,
+    tables_cells: Optional[Dict[int, int]] = None,
+    page_records: Optional[Dict[int, Dict[str, Any]]] = None,
+):
+    """Enrich readers_summary.json with per-page statistics and review flags.
+
+    ``payload`` is the in-memory summary document, ``tables_cells`` the
+    per-page table cell counts and ``page_records`` the unified_text rows by
+    page when the caller has them; otherwise they are read back from ``outdir``.
+    """
     import csv
-    import json
-    from collections import defaultdict
 
     summary_path = Path(outdir) / "readers_summary.json"
-    if not summary_path.exists():
-        return
-
-    try:
-        payload = json.loads(summary_path.read_text(encoding="utf-8"))
-    except Exception:
-        return
+    if payload is None:
+        if not summary_path.exists():
+            return
+        try:
+            payload = load_readers_json(summary_path.read_bytes())
+        except Exception:
+            return
 
     summary = payload.get("summary", {}) or {}
     pages = int(summary.get("page_count", 0) or 0)
@@ -848,34 +1158,41 @@ def process_readers_enrich_summary_on_disk(outdir: Path, opts: ReaderOptions):
     thresholds.setdefault("overlay_min_images", int(getattr(opts, "overlay_min_images", 1)))
     payload["thresholds"] = thresholds
 
-    tables_cells = defaultdict(int)
-    tables_path = Path(outdir) / "tables.jsonl"
-    if tables_path.exists():
-        try:
-            for line in tables_path.read_text(encoding="utf-8").splitlines():
-                if not line.strip():
-                    continue
-                obj = json.loads(line)
-                page_no = int(obj.get("page", 0) or 0)
-                rows = obj.get("rows", []) or []
-                cells = sum(len(r) for r in rows)
-                tables_cells[page_no] += cells
-        except Exception:
-            tables_cells = defaultdict(int)
-
-    record_map = {}
-    jsonl_path = Path(outdir) / "unified_text.jsonl"
-    if jsonl_path.exists():
-        for line in jsonl_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
+    if tables_cells is None:
+        tables_cells = {}
+        tables_path = Path(outdir) / "tables.jsonl"
+        if tables_path.exists():
+            cells_get = tables_cells.get
             try:
-                obj = json.loads(line)
+                with tables_path.open("rb", buffering=1 << 20) as handle:
+                    for line in handle:
+                        if not line.strip():
+                            continue
+                        obj = load_readers_json(line)
+                        page_no = int(obj.get("page", 0) or 0)
+                        tables_cells[page_no] = cells_get(page_no, 0) + sum(map(len, obj.get("rows") or []))
             except Exception:
-                continue
-            page_no = int(obj.get("page", 0) or 0)
-            record_map[page_no] = obj
+                tables_cells = {}
+
+    record_map = page_records
+    if record_map is None:
+        record_map = {}
+        jsonl_path = Path(outdir) / "unified_text.jsonl"
+        if jsonl_path.exists():
+            with jsonl_path.open("rb", buffering=1 << 20) as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    try:
+                        obj = load_readers_json(line)
+                    except Exception:
+                        continue
+                    # Only the per-page numbers are needed; keeping every page
+                    # text alive would hold the whole document in memory.
+                    if obj.get("chars") is not None:
+                        obj.pop("text", None)
+                    page_no = int(obj.get("page", 0) or 0)
+                    record_map[page_no] = obj
 
     lang_lookup = {int(entry.get("page", 0) or 0): entry.get("lang") or "unknown" for entry in summary.get("lang_per_page", []) or []}
     locale_lookup = {int(entry.get("page", 0) or 0): entry.get("locale") or "unknown" for entry in summary.get("locale_per_page", []) or []}
@@ -887,29 +1204,59 @@ def process_readers_enrich_summary_on_disk(outdir: Path, opts: ReaderOptions):
     any_thr = float(thresholds.get("any_min_conf", OCR_LOW_CONF))
     ocr_thr = float(thresholds.get("ocr_min_conf", 80.0))
     low_text_thr = OCR_LOW_TEXT_MIN_WORDS
-    for page in range(1, pages + 1):
-        record = record_map.get(page, {})
-        decision = (decisions[page - 1] if page - 1 < len(decisions) else record.get("source", "native")) or "native"
-        source = str(record.get("source") or decision)
-        conf = float(record.get("conf") or 0.0)
+    page_numbers = range(1, pages + 1)
+    missing = object()
+    empty_record: Dict[str, Any] = {}
+    records = [record_map.get(page, empty_record) for page in page_numbers]
+    page_decisions: List[str] = []
+    sources: List[str] = []
+    for record, decision in zip(records, list(decisions[:pages]) + [missing] * (pages - len(decisions))):
+        if decision is missing:
+            decision = record.get("source", "native")
+        decision = decision or "native"
+        page_decisions.append(decision)
+        sources.append(str(record.get("source") or decision))
+    confs = [float(record.get("conf") or 0.0) for record in records]
+    words_col = [int(record.get("words") or 0) for record in records]
+    chars_col = [int(record.get("chars") or len(str(record.get("text", "")))) for record in records]
+
+    # Flag thresholds are evaluated column-wise; the loop below only reads the masks.
+    ocr_mask = np.fromiter(("ocr" in source.lower() for source in sources), dtype=bool, count=pages)
+    conf_arr = np.asarray(confs, dtype=np.float64)
+    low_conf_mask = ((conf_arr < any_thr) | (ocr_mask & (conf_arr < ocr_thr))).tolist()
+    low_text_mask = (
+        ocr_mask
+        & ((np.asarray(words_col, dtype=np.int64) < low_text_thr) | (np.asarray(chars_col, dtype=np.int64) < SUSPICIOUS_TEXT_CHARS_MIN))
+    ).tolist()
+
+    page_rows = zip(
+        page_numbers,
+        records,
+        page_decisions,
+        sources,
+        confs,
+        words_col,
+        chars_col,
+        low_conf_mask,
+        low_text_mask,
+        [lang_lookup.get(page, "unknown") for page in page_numbers],
+        [locale_lookup.get(page, "unknown") for page in page_numbers],
+        [table_counts.get(page, 0) for page in page_numbers],
+        [int(tables_cells.get(page, 0)) for page in page_numbers],
+    )
+    csv_rows: List[List[Any]] = []
+    for page, record, decision, source, conf, words, chars, low_conf, low_text, lang, locale, tables_found, cells in page_rows:
         time_ms = float(record.get("time_ms") or 0.0)
-        words = int(record.get("words") or 0)
-        cells = int(tables_cells.get(page, 0))
-        chars = int(record.get("chars") or len(str(record.get("text", ""))))
         ocr_conf_avg = record.get("ocr_conf_avg")
-        lang = lang_lookup.get(page, "unknown")
-        locale = locale_lookup.get(page, "unknown")
-        tables_found = table_counts.get(page, 0)
         flags = []
-        if conf < any_thr or ("ocr" in source.lower() and conf < ocr_thr):
+        if low_conf:
             flags.append("low_conf_page")
-        if words < low_text_thr and "ocr" in source.lower():
-            flags.append("low_text_page")
-        if chars < SUSPICIOUS_TEXT_CHARS_MIN and "ocr" in source.lower() and "low_text_page" not in flags:
+        if low_text:
             flags.append("low_text_page")
         if page in table_fail_pages:
             flags.append("table_extract_error")
         has_table = cells > 0 or tables_found > 0
+        csv_rows.append([page, source, conf, words, chars, has_table, tables_found, cells, ",".join(flags), decision, lang, locale, time_ms])
         per_page.append(
             {
                 "page": page,
@@ -928,7 +1275,7 @@ def process_readers_enrich_summary_on_disk(outdir: Path, opts: ReaderOptions):
                 "time_ms": time_ms,
             }
         )
-        if "low_conf_page" in flags:
+        if low_conf:
             flagged.append(page)
     payload["per_page_stats"] = per_page
     low_conf_ratio_thr = float(thresholds.get("review_low_conf_ratio", SETTINGS.thresholds.get("low_conf_pages_ratio_review", 0.25)))
@@ -941,17 +1288,14 @@ def process_readers_enrich_summary_on_disk(outdir: Path, opts: ReaderOptions):
     payload.pop("qa", None)
     stamped = dict(payload)
     stamped.update(make_artifact_stamp(schema_name="stage_contract"))
-    summary_path.write_text(json.dumps(stamped, ensure_ascii=False, indent=2), encoding="utf-8")
+    save_readers_json(stamped, summary_path)
 
     csv_path = Path(outdir) / "per_page_stats.csv"
     try:
         with open(csv_path, "w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(
-                handle,
-                fieldnames=["page", "source", "conf", "ocr_words", "chars", "has_table", "tables_found", "table_cells", "flags", "decision", "lang", "locale", "time_ms"],
-            )
-            writer.writeheader()
-            writer.writerows(per_page)
+            writer = csv.writer(handle)
+            writer.writerow(PER_PAGE_CSV_FIELDS)
+            writer.writerows(csv_rows)
     except Exception:
         pass
 # === end auto-added enrichment ===
@@ -16,7 +16,7 @@ class Summary:
     page_decisions: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PageRecord:
     file: str
     page: int
@@ -29,6 +29,17 @@ class PageRecord:
     ocr_conf_avg: Optional[float] = None
 
 
+@dataclass(slots=True)
+class ReadersTimings:
+    """Accumulated per-stage wall time in milliseconds."""
+
+    text_extract: float = 0.0
+    lang_detect: float = 0.0
+    ocr: float = 0.0
+    table_detect: float = 0.0
+    table_extract: float = 0.0
+
+
 @dataclass
 class TableRecord:
     file: str
@@ -38,4 +49,4 @@ class TableRecord:
     metrics: Optional[Dict[str, float]] = None
 
 
-__all__ = ["Summary", "PageRecord", "TableRecord"]
+__all__ = ["Summary", "PageRecord", "ReadersTimings", "TableRecord"]
@@ -16,6 +16,8 @@ class ReaderOptions:
     dpi: int = 300
     psm: int = 6
     workers: int = 4
+    file_workers: int = 1
+    max_megapixels: float = 30.0
     use_pre: bool = False
     export_xlsx: bool = False
     verbose: bool = False
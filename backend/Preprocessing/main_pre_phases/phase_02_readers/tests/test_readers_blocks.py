@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from backend.Preprocessing.main_pre_phases.phase_02_readers.pipeline_workflow.readers_pipeline_main import (
+    ReadersOrchestrator,
+)
+from backend.Preprocessing.main_pre_phases.phase_02_readers.schemas.readers_schema_options import ReaderOptions
+
+
+def test_check_readers_list_like_detects_numbered_and_bulleted_items(tmp_path: Path) -> None:
+    orchestrator = ReadersOrchestrator(tmp_path, ReaderOptions())
+    assert orchestrator.check_readers_list_like("1. Anamnese")
+    assert orchestrator.check_readers_list_like("12) Befund")
+    assert orchestrator.check_readers_list_like("b) Therapie")
+    assert orchestrator.check_readers_list_like("• Ibuprofen 400 mg")
+    assert not orchestrator.check_readers_list_like("1.200,00 EUR")
+    assert not orchestrator.check_readers_list_like("Diagnose")
+
+
+_PARENT_PID = os.getpid()
+
+
+class _FlakyWorkerOrchestrator(ReadersOrchestrator):
+    """Fails ``bad.txt`` only inside worker processes, to exercise the in-line retry."""
+
+    def process_readers_text_native_page(self, path: Path) -> None:
+        if path.name == "bad.txt" and os.getpid() != _PARENT_PID:
+            raise RuntimeError("worker failure")
+        super().process_readers_text_native_page(path)
+
+
+def test_process_file_workers_retries_only_failed_inputs(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    paths = []
+    for name, text in (("a.txt", "Befund eins"), ("bad.txt", "Befund zwei"), ("c.txt", "Befund drei")):
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+
+    sequential = _FlakyWorkerOrchestrator(tmp_path / "seq", ReaderOptions()).process(paths)
+    parallel = _FlakyWorkerOrchestrator(tmp_path / "par", ReaderOptions(file_workers=2)).process(paths)
+
+    assert parallel["pages_count"] == sequential["pages_count"] == 3
+    assert parallel["summary"]["page_decisions"] == sequential["summary"]["page_decisions"]
+    assert parallel["summary"]["warnings"] == ["parallel_readers_fallback:RuntimeError"]
+    assert [e["step"] for e in parallel["tool_log"]] == [e["step"] for e in sequential["tool_log"]]
+    texts = []
+    for run in ("seq", "par"):
+        rows = (tmp_path / run / "readers" / "unified_text.jsonl").read_text(encoding="utf-8").splitlines()
+        texts.append([json.loads(row)["text"] for row in rows])
+    assert texts[1] == texts[0] == ["Befund eins", "Befund zwei", "Befund drei"]
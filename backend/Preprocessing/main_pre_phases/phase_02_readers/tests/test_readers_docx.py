@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from backend.Preprocessing.main_pre_phases.phase_02_readers.core_functions import readers_core_docx
+
+
+def test_get_docx_text_streaming_matches_python_docx(tmp_path: Path, monkeypatch) -> None:
+    docx = pytest.importorskip("docx")
+    pytest.importorskip("lxml")
+
+    document = docx.Document()
+    document.add_paragraph("Befund  ")
+    document.add_paragraph("Diagnose:\tGastritis")
+    table = document.add_table(rows=3, cols=3)
+    for i, row in enumerate(table.rows):
+        for j, cell in enumerate(row.cells):
+            cell.text = f"r{i}c{j}"
+    table.cell(0, 0).merge(table.cell(0, 1))
+    table.cell(1, 2).merge(table.cell(2, 2))
+    document.add_paragraph("Ende")
+    path = tmp_path / "sample.docx"
+    document.save(str(path))
+
+    streamed = readers_core_docx.get_docx_text_streaming(str(path))
+    monkeypatch.setattr(readers_core_docx, "etree", None)
+    assert streamed == readers_core_docx.get_docx_text(str(path))
+    assert streamed.startswith("Befund\nDiagnose:\tGastritis\nEnde\n")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from backend.Preprocessing.main_pre_helpers.main_pre_helpers_lang_detect import (
+    compute_language_and_locale_hint,
     compute_language_hint as compute_readers_language_hint,
     compute_locale_hint as compute_readers_locale_hint,
     compute_merged_language_hint as compute_readers_merged_language_hint,
@@ -21,3 +22,12 @@ def test_compute_readers_merged_language_hint_prefers_existing() -> None:
     assert compute_readers_merged_language_hint("de", "unknown") == "de"
     assert compute_readers_merged_language_hint("unknown", "en") == "en"
     assert compute_readers_merged_language_hint("de", "en") == "mixed"
+
+
+def test_compute_language_and_locale_hint_matches_separate_calls() -> None:
+    text = "Rechnung vom 12.03.2024 ueber 1.200,00 EUR"
+    assert compute_language_and_locale_hint(text) == (
+        compute_readers_language_hint(text),
+        compute_readers_locale_hint(text),
+    )
+    assert compute_language_and_locale_hint("") == ("unknown", "unknown")
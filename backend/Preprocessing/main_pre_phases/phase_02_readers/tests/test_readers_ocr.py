@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from backend.Preprocessing.main_pre_phases.phase_02_readers.core_functions import readers_core_ocr
+from backend.Preprocessing.main_pre_phases.phase_02_readers.core_functions.readers_core_ocr import (
+    compute_readers_budget_dpi,
+    compute_readers_ocr_data_conf,
+    compute_readers_ocr_data_text,
+    iter_readers_ocr_pages,
+    limit_readers_tesseract_threads,
+)
+
+
+def test_compute_readers_ocr_data_text_rebuilds_lines_and_paragraphs() -> None:
+    data = {
+        "text": ["", "", "", "Befund", "vom", "", "12.03.2024", "", "", "Diagnose:", "Gastritis"],
+        "conf": [-1, -1, -1, 91, 88, -1, 95, -1, -1, 90, "87.5"],
+        "block_num": [0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2],
+        "par_num": [0, 0, 1, 1, 1, 1, 1, 0, 1, 1, 1],
+        "line_num": [0, 0, 0, 1, 1, 2, 2, 0, 0, 1, 1],
+    }
+    assert compute_readers_ocr_data_text(data) == "Befund vom\n12.03.2024\n\nDiagnose: Gastritis"
+    assert compute_readers_ocr_data_conf(data) == 90.3
+
+
+def test_compute_readers_ocr_data_conf_without_words() -> None:
+    assert compute_readers_ocr_data_conf({"text": [""], "conf": [-1]}) is None
+
+
+def test_compute_readers_budget_dpi_caps_large_pages() -> None:
+    a4 = SimpleNamespace(rect=SimpleNamespace(width=595.0, height=842.0))
+    a0 = SimpleNamespace(rect=SimpleNamespace(width=2384.0, height=3370.0))
+    assert compute_readers_budget_dpi(a4, 300) == 300
+    assert compute_readers_budget_dpi(a4, 400, max_megapixels=5.0) == 227
+    assert compute_readers_budget_dpi(a0, 300) == 150
+    assert compute_readers_budget_dpi(a0, 300, max_megapixels=0) == 300
+
+
+def test_iter_readers_ocr_pages_renders_on_calling_thread(tmp_path: Path, monkeypatch) -> None:
+    fitz = pytest.importorskip("fitz")
+    pdf_path = tmp_path / "scan.pdf"
+    doc = fitz.open()
+    for _ in range(5):
+        doc.new_page(width=200, height=200)
+    doc.save(pdf_path)
+    doc.close()
+
+    render_threads = set()
+    recognise_threads = set()
+    render = readers_core_ocr.get_readers_ocr_page_image
+
+    def _render(*args, **kwargs):
+        render_threads.add(threading.current_thread().name)
+        return render(*args, **kwargs)
+
+    class _Engine:
+        def SetImage(self, img) -> None:
+            recognise_threads.add(threading.current_thread().name)
+
+        def GetUTF8Text(self) -> str:
+            return "Befund"
+
+        def MeanTextConf(self) -> int:
+            return 90
+
+        def End(self) -> None:
+            pass
+
+    monkeypatch.setattr(readers_core_ocr, "get_readers_ocr_page_image", _render)
+    monkeypatch.setattr(readers_core_ocr, "tesserocr", SimpleNamespace(PyTessBaseAPI=lambda **_: _Engine()))
+    pages = [4, 1, 5, 2]
+    results = list(iter_readers_ocr_pages(str(pdf_path), page_numbers_1based=pages, dpi=72, workers=3))
+
+    assert [item["page_no"] for item in results] == pages
+    assert render_threads == {threading.current_thread().name}
+    assert recognise_threads and threading.current_thread().name not in recognise_threads
+
+
+def _install_fake_tesseract(tmp_path: Path, monkeypatch):
+    pytesseract = pytest.importorskip("pytesseract")
+    fake = tmp_path / "tesseract"
+    # Fake binary: writes a one-word TSV whose text is the OMP_THREAD_LIMIT it saw.
+    fake.write_text(
+        "#!/bin/sh\n"
+        '[ "$1" = --version ] && echo "tesseract 5.3.0" && exit 0\n'
+        'printf "level\\tblock_num\\tpar_num\\tline_num\\tconf\\ttext\\n'
+        '5\\t1\\t1\\t1\\t91\\tomp=%s\\n" "$OMP_THREAD_LIMIT" > "$2.tsv"\n',
+        encoding="utf-8",
+    )
+    fake.chmod(0o755)
+    monkeypatch.setattr(pytesseract.pytesseract, "tesseract_cmd", str(fake))
+    monkeypatch.setattr(readers_core_ocr, "tesserocr", None)
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+
+
+def test_limit_readers_tesseract_threads_nests_and_restores(tmp_path: Path, monkeypatch) -> None:
+    _install_fake_tesseract(tmp_path, monkeypatch)
+    Image = pytest.importorskip("PIL.Image")
+    img = Image.new("L", (8, 8))
+
+    with limit_readers_tesseract_threads():
+        with limit_readers_tesseract_threads():
+            pass
+        data = readers_core_ocr.pytesseract.image_to_data(img, output_type=readers_core_ocr.pytesseract.Output.DICT)
+    assert data["text"] == ["omp=1"]
+    assert "OMP_THREAD_LIMIT" not in os.environ
+
+    monkeypatch.setenv("OMP_THREAD_LIMIT", "3")
+    with limit_readers_tesseract_threads():
+        assert os.environ["OMP_THREAD_LIMIT"] == "3"
+    assert os.environ["OMP_THREAD_LIMIT"] == "3"
+
+
+def test_iter_readers_ocr_pages_limits_threads_only_with_several_workers(tmp_path: Path, monkeypatch) -> None:
+    fitz = pytest.importorskip("fitz")
+    _install_fake_tesseract(tmp_path, monkeypatch)
+    pdf_path = tmp_path / "scan.pdf"
+    doc = fitz.open()
+    for _ in range(3):
+        doc.new_page(width=100, height=100)
+    doc.save(pdf_path)
+    doc.close()
+
+    def _texts(**kwargs):
+        results = iter_readers_ocr_pages(str(pdf_path), page_numbers_1based=[1, 2, 3], dpi=72, **kwargs)
+        return {item["text"] for item in results}
+
+    assert _texts(workers=1, ahead=4) == {"omp="}
+    assert _texts(workers=2) == {"omp=1"}
+    assert "OMP_THREAD_LIMIT" not in os.environ
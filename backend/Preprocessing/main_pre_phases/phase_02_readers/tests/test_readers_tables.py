@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from backend.Preprocessing.main_pre_phases.phase_02_readers.core_functions import readers_core_ocr_tables
+from backend.Preprocessing.main_pre_phases.phase_02_readers.core_functions.readers_core_ocr_tables import (
+    extract_tables_from_image,
+    process_readers_ocr_cells,
+)
+
+
+def _ruled_table(thickness: int) -> np.ndarray:
+    """White page with a 7x10 ruled grid; only cell (2, 3) holds text."""
+
+    img = np.full((7 * 40 + 20, 10 * 90 + 20), 255, dtype=np.uint8)
+    for row in range(8):
+        cv2.line(img, (10, 10 + row * 40), (10 + 10 * 90, 10 + row * 40), 0, thickness)
+    for col in range(11):
+        cv2.line(img, (10 + col * 90, 10), (10 + col * 90, 10 + 7 * 40), 0, thickness)
+    cv2.putText(img, "Befund", (10 + 3 * 90 + 8, 10 + 2 * 40 + 28), cv2.FONT_HERSHEY_SIMPLEX, 0.7, 0, 2)
+    return img
+
+
+def test_process_readers_ocr_cells_limits_tesseract_threads(monkeypatch) -> None:
+    seen = []
+
+    def _image_to_string(img, lang, config):
+        seen.append(os.environ.get("OMP_THREAD_LIMIT"))
+        return "x"
+
+    monkeypatch.setattr(readers_core_ocr_tables, "pytesseract", SimpleNamespace(image_to_string=_image_to_string))
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    cells = [np.zeros((4, 4), dtype=np.uint8)] * 10
+
+    assert process_readers_ocr_cells(cells, lang="deu") == ["x"] * 10
+    assert seen == ["1"] * 10
+    assert "OMP_THREAD_LIMIT" not in os.environ
+
+
+@pytest.mark.parametrize("thickness", [1, 2, 3])
+def test_extract_tables_from_image_skips_blank_ruled_cells(monkeypatch, thickness: int) -> None:
+    calls = []
+
+    def _image_to_string(img, lang, config):
+        calls.append(img.shape)
+        return "Befund"
+
+    monkeypatch.setattr(readers_core_ocr_tables, "pytesseract", SimpleNamespace(image_to_string=_image_to_string))
+    rows, metrics, _geometry = extract_tables_from_image(_ruled_table(thickness))
+
+    assert (metrics["rows"], metrics["cols"]) == (7, 10)
+    assert len(calls) == 1
+    assert rows[2][3] == "Befund"
+    assert sum(1 for row in rows for text in row if text) == 1
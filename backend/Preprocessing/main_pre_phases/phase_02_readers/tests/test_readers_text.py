@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from backend.Preprocessing.main_pre_phases.phase_02_readers.internal_helpers import readers_helper_text
+from backend.Preprocessing.main_pre_phases.phase_02_readers.internal_helpers.readers_helper_text import (
+    WRITEV_MAX_IOV,
+    save_readers_text_parts,
+)
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "writev"), reason="os.writev is POSIX only")
+
+
+def test_save_readers_text_parts_batches_and_resumes_short_writes(tmp_path: Path, monkeypatch) -> None:
+    parts = [f"Zeile {index} Größe\n" for index in range(WRITEV_MAX_IOV * 2 + 37)]
+    parts[5] = ""
+    real_writev = os.writev
+    batch_sizes = []
+
+    def short_writev(fd, buffers):
+        batch_sizes.append(len(buffers))
+        assert len(buffers) <= WRITEV_MAX_IOV
+        # Stop mid-buffer so the writer has to resume a partial chunk.
+        head = b"".join(buffers)[:13]
+        return real_writev(fd, [head])
+
+    monkeypatch.setattr(readers_helper_text.os, "writev", short_writev)
+    destination = tmp_path / "nested" / "unified_text.txt"
+    save_readers_text_parts(parts, destination)
+
+    assert destination.read_text(encoding="utf-8") == "".join(parts)
+    assert max(batch_sizes) == WRITEV_MAX_IOV
+    assert len(batch_sizes) > 3
+
+
+def test_save_readers_text_parts_leaves_mode_to_umask(tmp_path: Path) -> None:
+    previous = os.umask(0o002)
+    try:
+        destination = tmp_path / "unified_text.txt"
+        save_readers_text_parts(["a", "b"], destination)
+    finally:
+        os.umask(previous)
+    assert stat.S_IMODE(destination.stat().st_mode) == 0o664
+    assert destination.read_text(encoding="utf-8") == "ab"
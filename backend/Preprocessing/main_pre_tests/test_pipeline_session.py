@@ -1,11 +1,14 @@
 import argparse
-import json
 import mimetypes
 import unicodedata
 from dataclasses import asdict
 from pathlib import Path
 
 from backend.Preprocessing.main_pre_output.output_router import OutputRouter
+from backend.Preprocessing.main_pre_phases.phase_02_readers.internal_helpers.readers_helper_json import (
+    load_readers_json,
+    save_readers_json,
+)
 
 # ===================== Utilities =====================
 
@@ -22,25 +25,29 @@ def _convert(obj):
 
 def _encode_text(text: str) -> str:
     """Normalize text to NFC; caller should save as UTF-8."""
-    return unicodedata.normalize("NFC", text or "")
+    text = text or ""
+    if unicodedata.is_normalized("NFC", text):
+        return text
+    return unicodedata.normalize("NFC", text)
 
 
 def _load_unified_text(readers_dir: Path) -> str:
     """Prefer unified_text.txt; fallback to building from unified_text.jsonl."""
     txt = readers_dir / "unified_text.txt"
     if txt.exists():
-        return txt.read_text(encoding="utf-8", errors="ignore")
+        return txt.read_bytes().decode("utf-8", errors="replace")
     jl = readers_dir / "unified_text.jsonl"
     if jl.exists():
         lines = []
-        for line in jl.read_text(encoding="utf-8", errors="ignore").splitlines():
-            try:
-                obj = json.loads(line)
-                text_value = obj.get("text", "")
-                if text_value:
-                    lines.append(str(text_value))
-            except Exception:
-                continue
+        with jl.open("rb") as handle:
+            for line in handle:
+                try:
+                    obj = load_readers_json(line)
+                    text_value = obj.get("text", "")
+                    if text_value:
+                        lines.append(str(text_value))
+                except Exception:
+                    continue
         return "\n".join(lines)
     return ""
 
@@ -81,7 +88,7 @@ def run_readers(file_path: Path, outdir: Path, rec: dict, export_xlsx: bool) ->
     summary_path = outdir / "readers" / "readers_summary.json"
     if summary_path.exists():
         try:
-            return json.loads(summary_path.read_text(encoding="utf-8"))
+            return load_readers_json(summary_path.read_bytes())
         except Exception:
             return {}
     return {}
@@ -111,15 +118,9 @@ def run_encoding(readers_dir: Path, outdir: Path, file_path: Path | None = None)
                 },
             )
             unified = _convert(payload.get("unified_document") or {})
-            (outdir / "encoding_unified_document.json").write_text(
-                json.dumps(unified, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+            save_readers_json(unified, outdir / "encoding_unified_document.json")
             stats = _convert(payload.get("stage_stats") or {})
-            (outdir / "encoding_stage_stats.json").write_text(
-                json.dumps(stats, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+            save_readers_json(stats, outdir / "encoding_stage_stats.json")
             return unified
         except Exception:
             pass
@@ -133,10 +134,7 @@ def run_encoding(readers_dir: Path, outdir: Path, file_path: Path | None = None)
             "bytes_utf8": 0,
             "lines": 0,
         }
-        (outdir / "encoding_stats.json").write_text(
-            json.dumps(stats, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        save_readers_json(stats, outdir / "encoding_stats.json")
         return stats
 
     normalized = _encode_text(raw_text)
@@ -147,10 +145,7 @@ def run_encoding(readers_dir: Path, outdir: Path, file_path: Path | None = None)
         "bytes_utf8": len(normalized.encode("utf-8")),
         "lines": normalized.count("\n") + (1 if normalized else 0),
     }
-    (outdir / "encoding_stats.json").write_text(
-        json.dumps(stats, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    save_readers_json(stats, outdir / "encoding_stats.json")
     return stats
 
 
@@ -220,10 +215,7 @@ def main() -> None:
 
         # ---------- 1) Detection ----------
         detection_meta = run_detection(file_path)
-        (detector_dir / "detection_result.json").write_text(
-            json.dumps(detection_meta, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        save_readers_json(detection_meta, detector_dir / "detection_result.json")
 
         # ---------- 2) Readers -----------
         recommended = detection_meta.get("recommended", {}) if isinstance(detection_meta, dict) else {}
@@ -255,10 +247,7 @@ def main() -> None:
         )
 
     summary_path = session_dir / "session_report.json"
-    summary_path.write_text(
-        json.dumps(_convert(session_report), ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    save_readers_json(_convert(session_report), summary_path)
     print({
         "session": router.run_id,
         "outdir": str(session_dir),
@@ -1,5 +1,6 @@
 import subprocess
 import sys
+from typing import Iterator
 
 
 FORBIDDEN_PREFIXES = [
@@ -9,21 +10,23 @@ FORBIDDEN_PREFIXES = [
     "medflux/outputs/",
     "outputs/",
 ]
+FORBIDDEN = tuple(FORBIDDEN_PREFIXES)
 
 
-def get_tracked_files() -> list[str]:
-    out = subprocess.check_output(["git", "ls-files"], text=True)
-    return [line.strip() for line in out.splitlines() if line.strip()]
+def get_tracked_files() -> Iterator[str]:
+    """Yield tracked paths as git prints them instead of buffering the whole listing."""
+    with subprocess.Popen(["git", "ls-files"], stdout=subprocess.PIPE, text=True, bufsize=1 << 20) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            path = line.strip()
+            if path:
+                yield path
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
 
 
 def main() -> int:
-    tracked = get_tracked_files()
-    offenders: list[str] = []
-    for path in tracked:
-        for pref in FORBIDDEN_PREFIXES:
-            if path.startswith(pref):
-                offenders.append(path)
-                break
+    offenders = [path for path in get_tracked_files() if path.startswith(FORBIDDEN)]
 
     if offenders:
         print("Forbidden tracked paths detected (update .gitignore or move files):", file=sys.stderr)
@@ -1,29 +1,66 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from jsonschema import Draft202012Validator
 from core.validation.registry import get_schema_root
 
 
+@lru_cache(maxsize=None)
+def _get_schema_path_cached(root: Path, phase: str, io_norm: str) -> Path:
+    return root / "stages" / phase / f"{io_norm}.schema.json"
+
+
 def get_schema_path(phase: str, io: str) -> Path:
     io_norm = io.strip().lower()
     if io_norm not in {"input", "output"}:
         raise ValueError("io must be 'input' or 'output'")
-    return get_schema_root() / "stages" / phase / f"{io_norm}.schema.json"
+    # The root is re-read each call so MEDFLUX_SCHEMA_ROOT overrides still apply.
+    return _get_schema_path_cached(get_schema_root(), phase, io_norm)
 
 
-def load_schema(phase: str, io: str) -> Dict[str, Any]:
-    path = get_schema_path(phase, io)
+@lru_cache(maxsize=None)
+def _load_schema_cached(path: Path) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def validate_json(payload: Any, schema: Dict[str, Any]) -> None:
+def load_schema(phase: str, io: str) -> Dict[str, Any]:
+    """Parse a stage schema once per session; the returned dict is shared, do not mutate it."""
+    return _load_schema_cached(get_schema_path(phase, io))
+
+
+@lru_cache(maxsize=None)
+def _get_validator_cached(path: Path) -> Draft202012Validator:
+    schema = _load_schema_cached(path)
     Draft202012Validator.check_schema(schema)
-    Draft202012Validator(schema).validate(payload)
+    return Draft202012Validator(schema)
+
+
+def get_validator(phase: str, io: str) -> Draft202012Validator:
+    """Return a validator for a stage schema, checking the schema only on first use."""
+    return _get_validator_cached(get_schema_path(phase, io))
+
+
+def validate_json(
+    payload: Any,
+    schema: Optional[Dict[str, Any]] = None,
+    *,
+    validator: Optional[Draft202012Validator] = None,
+) -> None:
+    if validator is None:
+        if schema is None:
+            raise ValueError("schema or validator is required")
+        Draft202012Validator.check_schema(schema)
+        validator = Draft202012Validator(schema)
+    validator.validate(payload)
+
+
+def validate_payload(phase: str, io: str, payload: Any) -> None:
+    validate_json(payload, validator=get_validator(phase, io))
 
 
 def _parse_stage(stage: str) -> Tuple[str, str]:
@@ -41,68 +78,79 @@ def _expected_stage_name(phase: str) -> str:
     return phase
 
 
+@lru_cache(maxsize=None)
+def _get_stage_info(stage: str) -> Tuple[str, str, str]:
+    """Return (phase, kind, expected stage name) for a stage label, parsed once per label."""
+    phase, kind = _parse_stage(stage)
+    return phase, kind, _expected_stage_name(phase)
+
+
 def cross_field_checks(payload: Dict[str, Any], stage: str) -> None:
     """Lightweight cross-field consistency checks.
 
     - For all: run_id (if present) is non-empty.
     - For output payloads: stage names and counts are coherent when fields are present.
+
+    Payloads are plain JSON-shaped data, so exact ``type(...) is`` checks are used.
     """
-    if not isinstance(payload, dict):
+    _dict, _list, _str = dict, list, str
+    if type(payload) is not _dict:
         return
 
-    phase, kind = _parse_stage(stage)
+    _, kind, expected_stage = _get_stage_info(stage)
+    get = payload.get
 
     # Basic run_id sanity
-    run_id = payload.get("run_id")
-    if run_id is not None and (not isinstance(run_id, str) or not run_id.strip()):
+    run_id = get("run_id")
+    if run_id is not None and (type(run_id) is not _str or not run_id.strip()):
         raise AssertionError(f"{stage}: run_id must be a non-empty string when present")
 
     # Only apply the following to outputs
     if kind != "output":
         return
 
-    expected_stage = _expected_stage_name(phase)
+    ud = get("unified_document")
+    stats = get("stage_stats")
+    ud_items = ud.get("items") if type(ud) is _dict else None
+    if type(ud_items) is not _list:
+        ud_items = None
 
     # versioning presence (shape is enforced by schema, presence checked here for clarity)
-    if "versioning" in payload and isinstance(payload["versioning"], dict):
-        v = payload["versioning"]
-        if "app_version" not in v:
-            raise AssertionError(f"{stage}: versioning.app_version must be present")
+    versioning = get("versioning")
+    if type(versioning) is _dict and "app_version" not in versioning:
+        raise AssertionError(f"{stage}: versioning.app_version must be present")
 
     # unified_document stage name
-    ud = payload.get("unified_document")
-    if isinstance(ud, dict):
-        if "stage" in ud and ud.get("stage") != expected_stage:
+    if type(ud) is _dict:
+        ud_stage = ud.get("stage", expected_stage)
+        if ud_stage != expected_stage:
             raise AssertionError(
-                f"{stage}: unified_document.stage={ud.get('stage')} != expected {expected_stage}"
+                f"{stage}: unified_document.stage={ud_stage} != expected {expected_stage}"
             )
-        items = ud.get("items") if isinstance(ud.get("items"), list) else None
-        src = ud.get("source") if isinstance(ud.get("source"), dict) else None
-        if isinstance(items, list) and isinstance(src, dict):
+        src = ud.get("source")
+        if ud_items is not None and type(src) is _dict:
             inc = src.get("items_included")
-            if isinstance(inc, int) and inc != len(items):
+            if isinstance(inc, int) and inc != len(ud_items):
                 raise AssertionError(
-                    f"{stage}: source.items_included={inc} must equal len(unified_document.items)={len(items)}"
+                    f"{stage}: source.items_included={inc} must equal len(unified_document.items)={len(ud_items)}"
                 )
 
     # stage_stats coherence
-    stats = payload.get("stage_stats")
-    if isinstance(stats, dict):
+    if type(stats) is _dict:
         # stage field equals expected when present
         stg = stats.get("stage")
-        if isinstance(stg, str) and stg != expected_stage:
+        if type(stg) is _str and stg != expected_stage:
             raise AssertionError(f"{stage}: stage_stats.stage={stg} != expected {expected_stage}")
         # total_items vs unified_document.items length when available
         total = stats.get("total_items")
-        if isinstance(total, int) and isinstance(ud, dict) and isinstance(ud.get("items"), list):
-            if total != len(ud["items"]):
-                raise AssertionError(
-                    f"{stage}: stage_stats.total_items={total} must equal len(unified_document.items)={len(ud['items'])}"
-                )
+        if isinstance(total, int) and ud_items is not None and total != len(ud_items):
+            raise AssertionError(
+                f"{stage}: stage_stats.total_items={total} must equal len(unified_document.items)={len(ud_items)}"
+            )
         # readers phase: documents should match number of items when present
         docs = stats.get("documents")
-        if isinstance(docs, int) and isinstance(payload.get("items"), list):
-            if docs != len(payload["items"]):
-                raise AssertionError(
-                    f"{stage}: stage_stats.documents={docs} must equal len(items)={len(payload['items'])}"
-                )
+        items = get("items")
+        if isinstance(docs, int) and type(items) is _list and docs != len(items):
+            raise AssertionError(
+                f"{stage}: stage_stats.documents={docs} must equal len(items)={len(items)}"
+            )
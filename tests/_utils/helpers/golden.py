@@ -4,10 +4,12 @@ import json
 import re
 from pathlib import Path
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
+from tests._utils.helpers.jsonio import load_json_file
 
-_VOLATILE_KEYS = {
+
+_VOLATILE_KEYS = frozenset({
     "timestamp",
     "timestamps",
     "created_at",
@@ -16,43 +18,72 @@ _VOLATILE_KEYS = {
     "trace_id",
     "span_id",
     "uuid",
-}
+})
+
+
+# Read at import; set UPDATE_GOLDEN / CI in the environment before pytest starts.
+_UPDATE_GOLDEN = os.environ.get("UPDATE_GOLDEN", "").strip().lower() in {"1", "true", "yes"}
+_IS_CI = bool(os.environ.get("CI"))
+
+# Relative on purpose: resolved against the working directory the suite runs from.
+_GOLDEN_BASE = Path("tests") / "golden"
 
 
 _ISO_TS_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+\-]\d{2}:?\d{2})?$")
+_ISO_TS_MIN_LEN = len("YYYY-MM-DDTHH:MM:SS")
 
 
-def _normalize(obj: Any) -> Any:
-    if isinstance(obj, dict):
-        out: Dict[str, Any] = {}
-        for k, v in obj.items():
-            if k in _VOLATILE_KEYS:
-                continue
-            out[k] = _normalize(v)
-        return out
-    if isinstance(obj, list):
-        return [_normalize(x) for x in obj]
-    if isinstance(obj, str):
-        if _ISO_TS_RE.match(obj):
-            return "<ts>"
-        return obj
+def _normalize_leaf(obj: Any) -> Any:
+    # Cheap shape check keeps most strings out of the regex engine.
+    if (
+        isinstance(obj, str)
+        and len(obj) >= _ISO_TS_MIN_LEN
+        and obj[4] == "-"
+        and obj[7] == "-"
+        and _ISO_TS_RE.match(obj)
+    ):
+        return "<ts>"
     return obj
 
 
+def _normalize(obj: Any) -> Any:
+    """Drop volatile keys and mask timestamps, walking the payload with an explicit stack."""
+    root: List[Any] = [None]
+    stack: List[Tuple[Any, Any, Any]] = [(root, 0, obj)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        parent, key, value = pop()
+        if isinstance(value, dict):
+            out: Dict[str, Any] = {k: v for k, v in value.items() if k not in _VOLATILE_KEYS}
+            for k, v in out.items():
+                if isinstance(v, (dict, list)):
+                    push((out, k, v))
+                else:
+                    out[k] = _normalize_leaf(v)
+            parent[key] = out
+        elif isinstance(value, list):
+            items: List[Any] = [None] * len(value)
+            for i, v in enumerate(value):
+                if isinstance(v, (dict, list)):
+                    push((items, i, v))
+                else:
+                    items[i] = _normalize_leaf(v)
+            parent[key] = items
+        else:
+            parent[key] = _normalize_leaf(value)
+    return root[0]
+
+
 def assert_json_golden(actual: Any, golden_rel_path: str | Path) -> None:
-    base = Path("tests") / "golden"
-    golden_path = base / Path(golden_rel_path)
-    with golden_path.open("r", encoding="utf-8") as f:
-        expected = json.load(f)
+    golden_path = _GOLDEN_BASE / golden_rel_path
+    expected = load_json_file(golden_path)
     norm_actual = _normalize(actual)
     norm_expected = _normalize(expected)
     if norm_actual != norm_expected:
-        if str(os.environ.get("UPDATE_GOLDEN", "")).strip().lower() in {"1", "true", "yes"} and not os.environ.get("CI"):
-            golden_path.write_text(
-                json.dumps(norm_actual, ensure_ascii=False, indent=2) + "\n",
-                encoding="utf-8",
-            )
+        if _UPDATE_GOLDEN and not _IS_CI:
+            # Stdlib output keeps the existing formatting (1e+16, NaN, big ints).
+            golden_path.write_text(json.dumps(norm_actual, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
             return
-        assert (
-            norm_actual == norm_expected
-        ), f"Golden mismatch: {golden_path}.\nExpected: {json.dumps(norm_expected, ensure_ascii=False, indent=2)}\nActual:   {json.dumps(norm_actual, ensure_ascii=False, indent=2)}"
+        # Rewritten by pytest (see tests/conftest.py), so failures show a structural diff.
+        assert norm_actual == norm_expected, f"Golden mismatch: {golden_path}"
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:  # Optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - orjson not installed
+    orjson = None
+
+
+def load_json_file(path: Path) -> Any:
+    """Parse a JSON file, with orjson when it is installed."""
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity and integers wider than 64 bits are valid for the stdlib parser.
+            pass
+    return json.loads(data)
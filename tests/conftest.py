@@ -2,7 +2,7 @@ import logging
 import os
 import random
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import pytest
 import sys
@@ -14,6 +14,9 @@ _REPO_ROOT = _THIS_FILE.parent.parent
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
+# Let helper asserts (e.g. golden comparisons) produce pytest diffs.
+pytest.register_assert_rewrite("tests._utils.helpers")
+
 
 def _seed_all(seed: int = 1337) -> None:
     random.seed(seed)
@@ -35,6 +38,18 @@ def _tests_root() -> Path:
     return Path.cwd() / "tests"
 
 
+_MARKER_DIRS = {
+    "unit": "unit",
+    "component": "component",
+    "contract": "contract",
+    "integration": "integration",
+    "golden": "golden",
+    "smoke": "smoke",
+    "e2e": "e2e",
+    "perf": "perf",
+}
+
+
 def _marker_for_path(p: Path) -> str:
     root = _tests_root()
     try:
@@ -42,17 +57,7 @@ def _marker_for_path(p: Path) -> str:
     except Exception:
         return "unit"
     first: Optional[str] = rel.parts[0] if rel.parts else None
-    mapping = {
-        "unit": "unit",
-        "component": "component",
-        "contract": "contract",
-        "integration": "integration",
-        "golden": "golden",
-        "smoke": "smoke",
-        "e2e": "e2e",
-        "perf": "perf",
-    }
-    return mapping.get(first or "", "unit")
+    return _MARKER_DIRS.get(first or "", "unit")
 
 
 def pytest_sessionstart(session: pytest.Session) -> None:  # noqa: D401
@@ -63,11 +68,40 @@ def pytest_sessionstart(session: pytest.Session) -> None:  # noqa: D401
     _setup_logging()
 
 
+@pytest.fixture(scope="session")
+def validators() -> Dict[Tuple[str, str], object]:
+    """Compiled stage validators keyed by (phase, io), built once per session."""
+    from core.validation.registry import discover_phase, get_schema_root
+    from tests._utils.helpers.contracts import get_validator
+
+    out: Dict[Tuple[str, str], object] = {}
+    stages = get_schema_root() / "stages"
+    for phase_dir in sorted(p for p in stages.iterdir() if p.is_dir()):
+        try:
+            discover_phase(phase_dir.name)
+        except FileNotFoundError:
+            continue
+        for io in ("input", "output"):
+            out[(phase_dir.name, io)] = get_validator(phase_dir.name, io)
+    return out
+
+
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    # Match item paths against the tests root as strings; only fall back to
+    # resolving (symlinks, odd spellings) when neither root prefix matches.
+    root = _tests_root()
+    prefixes = tuple({str(root) + os.sep, str(root.resolve()) + os.sep})
     for item in items:
         try:
-            p = Path(str(item.fspath))
+            p_str = str(item.fspath)
         except Exception:
             continue
-        marker_name = _marker_for_path(p)
+        marker_name = None
+        for prefix in prefixes:
+            if p_str.startswith(prefix):
+                first = p_str[len(prefix):].split(os.sep, 1)[0]
+                marker_name = _MARKER_DIRS.get(first, "unit")
+                break
+        if marker_name is None:
+            marker_name = _marker_for_path(Path(p_str))
         item.add_marker(getattr(pytest.mark, marker_name))
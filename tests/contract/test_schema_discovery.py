@@ -1,12 +1,25 @@
 import pytest
-from pathlib import Path
 from jsonschema import Draft202012Validator
+from jsonschema.exceptions import SchemaError, best_match
 
 from core.validation.registry import get_schema_root
+from tests._utils.helpers.jsonio import load_json_file
 
 
 pytestmark = pytest.mark.contract
 
+# Metaschema validator built once; equivalent to Draft202012Validator.check_schema per file.
+_META = Draft202012Validator(
+    Draft202012Validator.META_SCHEMA, format_checker=Draft202012Validator.FORMAT_CHECKER
+)
+
+
+def _check_schema(obj) -> None:
+    # Same error selection as check_schema: the best match, not the first one found.
+    error = best_match(_META.iter_errors(obj))
+    if error is not None:
+        raise SchemaError.create_from(error)
+
 
 def test_all_stage_schemas_are_valid():
     root = get_schema_root() / "stages"
@@ -15,10 +28,6 @@ def test_all_stage_schemas_are_valid():
         for name in ("input.schema.json", "output.schema.json"):
             sp = phase_dir / name
             assert sp.exists(), f"Missing schema file: {sp}"
-            data = sp.read_text(encoding="utf-8")
-            # Load as JSON via Draft202012Validator.check_schema expects dict; use json module
-            import json
-
-            obj = json.loads(data)
-            Draft202012Validator.check_schema(obj)
+            obj = load_json_file(sp)
+            _check_schema(obj)
             assert "$id" in obj and isinstance(obj["$id"], str)
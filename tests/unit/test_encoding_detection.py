@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# Importing through the phase_01_encoding package pulls in its pipeline; the
+# helper itself only needs the standard library, so load it from its file.
+_HELPER = (
+    Path(__file__).resolve().parents[2]
+    / "backend/Preprocessing/main_pre_phases/phase_01_encoding/internal_helpers/encoding_helper_detection.py"
+)
+_spec = importlib.util.spec_from_file_location("_encoding_helper_detection", _HELPER)
+detection_helper = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = detection_helper
+_spec.loader.exec_module(detection_helper)
+
+
+@pytest.mark.unit
+def test_encoding_detection_keeps_non_utf8_text(tmp_path: Path) -> None:
+    utf8 = tmp_path / "utf8.txt"
+    utf8.write_bytes("Größe ".encode("utf-8") * 20000)
+    detection = detection_helper.get_encoding_detection_for_path(str(utf8), sample_bytes=1001)
+    assert detection.encoding == "utf-8" and detection.is_utf8
+
+    utf16 = tmp_path / "utf16.txt"
+    utf16.write_text("Befund", encoding="utf-16")
+    assert detection_helper.get_encoding_detection_for_path(str(utf16)).encoding == "utf-16"
+
+    latin = tmp_path / "latin.txt"
+    latin.write_bytes("Grüße".encode("latin-1"))
+    outcome = detection_helper.normalize_encoding_file_to_utf8(str(latin), dest_path=str(tmp_path / "out.txt"))
+    assert outcome.ok and not outcome.detected.is_utf8
+    assert Path(outcome.normalized_path).read_text(encoding="utf-8") == "Grüße"
+
+
+@pytest.mark.unit
+def test_encoding_detection_validates_the_whole_sample(tmp_path: Path) -> None:
+    mixed = tmp_path / "mixed.txt"
+    mixed.write_bytes(b"a" * 70000 + "Grüße".encode("latin-1"))
+    detection = detection_helper.get_encoding_detection_for_path(str(mixed))
+    assert not detection.is_utf8
+    assert (detection.encoding, detection.confidence) != ("utf-8", 1.0)
+
+
+@pytest.mark.unit
+def test_encoding_normalization_strips_bom_and_composes_nfc(tmp_path: Path) -> None:
+    src = tmp_path / "bom.txt"
+    src.write_bytes(b"\xef\xbb\xbf" + "Gro\u0308\u00dfe\r\nok".encode("utf-8"))
+    outcome = detection_helper.normalize_encoding_file_to_utf8(str(src), dest_path=str(tmp_path / "out.txt"))
+    assert outcome.ok and outcome.detected.bom
+    assert Path(outcome.normalized_path).read_bytes() == "Größe\nok".encode("utf-8")
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests._utils.helpers.golden import _ISO_TS_RE, _VOLATILE_KEYS, _normalize
+from tests._utils.helpers.jsonio import load_json_file
+
+
+@pytest.mark.unit
+def test_load_json_file_accepts_stdlib_only_values(tmp_path: Path) -> None:
+    path = tmp_path / "golden.json"
+    path.write_text('{"big": 123456789012345678901234567890, "nan": NaN, "f": 1e+16}', encoding="utf-8")
+    data = load_json_file(path)
+    assert data["big"] == 123456789012345678901234567890
+    assert data["nan"] != data["nan"]
+    assert data["f"] == 1e16
+
+
+def _reference_normalize(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {k: _reference_normalize(v) for k, v in obj.items() if k not in _VOLATILE_KEYS}
+    if isinstance(obj, list):
+        return [_reference_normalize(x) for x in obj]
+    if isinstance(obj, str) and _ISO_TS_RE.match(obj):
+        return "<ts>"
+    return obj
+
+
+@pytest.mark.unit
+def test_normalize_matches_recursive_reference() -> None:
+    payload = {
+        "z": 1,
+        "run_id": "abc",
+        "items": [
+            {"created_at": "x", "when": "2024-01-02T03:04:05Z", "tags": ["2024-01-02 03:04:05", "2024-01-02"]},
+            [[{"uuid": 1, "n": None}], []],
+            "2024-01-02T03:04:05.123+01:00\n",
+        ],
+        "meta": {"deep": {"deeper": {"trace_id": "t", "v": [1.5, True, "plain"]}}, "a": {}},
+        "timestamp": {"nested": "dropped"},
+        "b": "2024-01-02T03:04:05 trailing",
+    }
+    normalized = _normalize(payload)
+    expected = _reference_normalize(payload)
+    assert normalized == expected
+    assert json.dumps(normalized) == json.dumps(expected)